@@ -38,11 +38,33 @@ COLORS = {
 }
 
 
+# Blackjack value per rank with aces counted as 11 (10 may arrive as T)
+RANK_VALUES = {'A': 11, '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9,
+               'T': 10, '10': 10, 'J': 10, 'Q': 10, 'K': 10}
+
+
 # Utility functions
 def total_cards(decks):
     return decks * 52
 
 
+def hand_total(hand):
+    """Best total for a hand of (rank, suit) cards and whether an ace still counts as 11."""
+    total = 0
+    aces = 0
+    for rank, suit in hand:
+        total += RANK_VALUES[rank]
+        if rank == 'A':
+            aces += 1
+
+    # Adjust aces
+    while total > 21 and aces > 0:
+        total -= 10
+        aces -= 1
+
+    return total, aces > 0
+
+
 # Helper function to normalize rank display
 def normalize_rank_display(rank):
     """Convert T to 10 for display purposes."""
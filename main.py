@@ -1,3 +1,4 @@
+import logging
 import tkinter as tk
 import sys
 import os
@@ -1268,6 +1269,8 @@ class BlackjackTrackerApp(tk.Tk):
 
 def main():
     """Main entry point."""
+    # UI modules log per-event detail at DEBUG; keep it quiet in normal runs
+    logging.basicConfig(level=logging.WARNING, format="%(name)s: %(message)s")
     try:
         print("MAIN: Starting application")
         app = BlackjackTrackerApp()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+test_comp_panel.py - Test CompPanel composition bookkeeping
+"""
+
+import sys
+import os
+
+# Add current directory to path for imports
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from ui.panels.comp_panel import CompPanel, INTERNAL_RANKS
+
+
+def _bare_panel(decks=8):
+    """CompPanel state without building any Tk widgets."""
+    panel = CompPanel.__new__(CompPanel)
+    panel.decks = decks
+    panel._full_per_rank = decks * 4
+    panel.comp = dict.fromkeys(INTERNAL_RANKS, 0)
+    panel._seen = 0
+    panel._mark_dirty = lambda *ranks: None
+    return panel
+
+
+def test_restore_merges_10_and_t():
+    """10 and T restore into the single tracked T count."""
+    panel = _bare_panel()
+    panel.restore({'A': 2, '10': 3, 'T': 1, 'K': 4})
+
+    assert set(panel.comp) == set(INTERNAL_RANKS)
+    assert panel.comp['T'] == 4
+    assert panel.comp['A'] == 2
+    assert panel.comp['K'] == 4
+    assert panel.cards_left() == 8 * 52 - 10
+
+
+def test_restore_skips_mystery_and_unknown_ranks():
+    """'?' and ranks outside the shoe are not counted."""
+    panel = _bare_panel()
+    panel.restore({'5': 1, '?': 2, 'X': 3})
+
+    assert set(panel.comp) == set(INTERNAL_RANKS)
+    assert panel.comp['5'] == 1
+    assert panel.cards_left() == 8 * 52 - 1
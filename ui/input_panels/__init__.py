@@ -5,7 +5,7 @@ from .dealer_panel import DealerPanel
 
 # EXISTING: Keep these as-is
 from .shared_input_panel import SharedInputPanel
-from .suit_selection import get_suit_selection
+# suit_selection is not imported here: the panels load it on the first rank click
 
 # DEPRECATED: Comment out old import (but don't delete yet for safety)
 # from .player_dealer_panel import PlayerOrDealerPanel
@@ -18,7 +18,6 @@ __all__ = [
     
     # EXISTING exports
     'SharedInputPanel',
-    'get_suit_selection',
     
     # DEPRECATED (will remove in Step 4)
     # 'PlayerOrDealerPanel'
@@ -1,11 +1,12 @@
+import logging
 import tkinter as tk
-import sys
-import os
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from constants import RANKS, COLORS, hand_total, normalize_rank_display
 
-from constants import RANKS, COLORS, normalize_rank_display
-from .suit_selection import get_suit_selection
+logger = logging.getLogger(__name__)
+
+# Button/card label per rank, resolved once at import
+_DISPLAY_RANK = {r: normalize_rank_display(r) for r in (*RANKS, 'T')}
 
 
 class BaseCardPanel(tk.Frame):
@@ -38,6 +39,7 @@ class BaseCardPanel(tk.Frame):
 
     def rank_clicked(self, rank):
         """Basic rank click - show suit selection."""
+        from .suit_selection import get_suit_selection  # Deferred until the first click
 
         def on_suit_selected(suit):
             self.input_card(rank, suit, is_hole=False)
@@ -46,7 +48,7 @@ class BaseCardPanel(tk.Frame):
 
     def input_card(self, rank, suit, is_hole=False):
         """FIXED: Input card without duplicates."""
-        print(f"BASE_INPUT: {rank}{suit}")
+        logger.debug("Input: %s%s", rank, suit)
 
         # Add to current hand (ONCE!)
         self.hands[self.current_hand].append((rank, suit))
@@ -58,9 +60,7 @@ class BaseCardPanel(tk.Frame):
         # Callback
         self.on_card(rank, suit, is_hole=False)
 
-        # Let subclass handle display
-        if hasattr(self, 'update_display'):
-            self.update_display()
+        # Subclasses redraw after this returns (PlayerPanel only the touched hand)
 
     def undo(self, hand_idx=None):
         """Basic undo.
@@ -79,9 +79,7 @@ class BaseCardPanel(tk.Frame):
             self.is_done = False
             self.on_undo(rank=last_card[0], is_hole=False)
 
-            if hasattr(self, 'update_display'):
-                self.update_display()
-
+            # Subclasses redraw after this returns (PlayerPanel only the touched hand)
             return last_card
 
     def calculate_score(self, hand_idx=None):
@@ -92,27 +90,7 @@ class BaseCardPanel(tk.Frame):
         if hand_idx >= len(self.hands):
             return 0
 
-        hand = self.hands[hand_idx]
-        total = 0
-        aces = 0
-
-        for rank, suit in hand:
-            if rank in ['J', 'Q', 'K']:
-                total += 10
-            elif rank in ['T', '10']:
-                total += 10
-            elif rank == 'A':
-                aces += 1
-                total += 11
-            else:
-                total += int(rank)
-
-        # Adjust aces
-        while total > 21 and aces > 0:
-            total -= 10
-            aces -= 1
-
-        return total
+        return hand_total(self.hands[hand_idx])[0]
 
     def reset(self):
         """Basic reset."""
@@ -139,7 +117,7 @@ class BaseCardPanel(tk.Frame):
         else:
             card_color = 'black'
 
-        display_rank = normalize_rank_display(rank)
+        display_rank = _DISPLAY_RANK.get(rank, rank)
 
         # Card size based on context
         if self.is_player and len(self.hands) > 1:
@@ -182,17 +160,15 @@ class BaseCardPanel(tk.Frame):
 
     def get_score_display(self, hand_idx=None):
         """Get formatted score display - SHARED formatting logic."""
-        score = self.calculate_score(hand_idx)
-        if score == 0:
-            return ""
-
         if hand_idx is None:
             hand_idx = self.current_hand
         if hand_idx >= len(self.hands):
             return ""
 
         hand = self.hands[hand_idx]
-        has_usable_ace = self._has_usable_ace(hand)
+        score, has_usable_ace = hand_total(hand)
+        if score == 0:
+            return ""
 
         if score > 21:
             return f"Bust {score}"
@@ -205,25 +181,7 @@ class BaseCardPanel(tk.Frame):
 
     def _has_usable_ace(self, hand):
         """Check if hand has usable ace - SHARED logic."""
-        total = 0
-        aces = 0
-
-        for rank, suit in hand:
-            if rank in ['J', 'Q', 'K']:
-                total += 10
-            elif rank in ['T', '10']:
-                total += 10
-            elif rank == 'A':
-                aces += 1
-                total += 11
-            else:
-                total += int(rank)
-
-        while total > 21 and aces > 0:
-            total -= 10
-            aces -= 1
-
-        return aces > 0
+        return hand_total(hand)[1]
 
     def add_card(self, rank, suit):
         """Add card to current hand - CONVENIENCE method."""
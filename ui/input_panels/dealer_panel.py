@@ -1,20 +1,18 @@
+import logging
 import tkinter as tk
-import sys
-import os
+from functools import partial
 
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from constants import RANKS, COLORS
+from .base_card_panel import BaseCardPanel, _DISPLAY_RANK
 
-from constants import RANKS, COLORS, normalize_rank_display
-from .base_card_panel import BaseCardPanel
-from .suit_selection import get_suit_selection
+logger = logging.getLogger(__name__)
 
 
 class DealerPanel(BaseCardPanel):
     """Dealer panel with hole card support and UPDATED stacked card display."""
 
     def __init__(self, parent, on_card, on_undo, hole_card_reveal=False, on_global_undo=None, undo_manager=None):
-        print(f"DEALER_PANEL: Creating new DealerPanel instance in parent: {parent}")
-        print(f"DEALER_PANEL: Parent has {len(parent.winfo_children())} existing children")
+        logger.debug("Creating new DealerPanel instance in parent: %s", parent)
 
         super().__init__(parent, "DEALER", is_player=False, is_dealer=True,
                          on_card=on_card, on_undo=on_undo)
@@ -35,6 +33,10 @@ class DealerPanel(BaseCardPanel):
 
         # Track order of dealer inputs for accurate undo handling
         self._history = []
+        # Card slots currently drawn (see _card_slots); lets hits append in place
+        self._displayed_slots = []
+        # Set while an idle-time redraw is queued (see _schedule_update)
+        self._update_pending = False
 
         self._build_dealer_ui()
 
@@ -53,18 +55,16 @@ class DealerPanel(BaseCardPanel):
             # Store reference to comp_panel (will be set by main app)
             self.comp_panel = None
 
-            print("DEALER_PANEL: Probability panel added successfully")
-        except Exception as e:
-            print(f"DEALER_PANEL: Could not add probability panel: {e}")
-            import traceback
-            traceback.print_exc()  # This will show the full error
+            logger.debug("Probability panel added successfully")
+        except Exception:
+            logger.exception("Could not add probability panel")  # Includes the full error
             self.prob_panel = None
             self.comp_panel = None
 
-            print("DEALER_PANEL: Probability panel added successfully")
+            logger.debug("Probability panel added successfully")
 
         except Exception as e:
-            print(f"DEALER_PANEL: Could not add probability panel: {e}")
+            logger.warning("Could not add probability panel: %s", e)
             self.prob_panel = None
             self.comp_panel = None
 
@@ -73,28 +73,24 @@ class DealerPanel(BaseCardPanel):
 
     def update_dealer_probabilities(self):
         """Update the probability panel based on current upcard."""
-        print(f"UPDATE_DEALER_PROBS: Called")
-        print(f"  prob_panel exists: {self.prob_panel is not None}")
-        print(f"  comp_panel exists: {self.comp_panel is not None}")
+        logger.debug("Update dealer probabilities: prob_panel=%s comp_panel=%s",
+                     self.prob_panel is not None, self.comp_panel is not None)
 
         if not self.prob_panel:
-            print("UPDATE_DEALER_PROBS: No prob_panel - exiting")
+            logger.debug("No prob_panel - skipping probability update")
             return
 
         if not self.comp_panel:
-            print("UPDATE_DEALER_PROBS: No comp_panel - exiting")
+            logger.debug("No comp_panel - skipping probability update")
             return
 
         # Get the dealer's upcard
-        print(f"  hands: {self.hands}")
         if self.hands and self.hands[0]:
             upcard_rank = self.hands[0][0][0]  # First card's rank
-            print(f"UPDATE_DEALER_PROBS: Upcard is {upcard_rank}")
-            print(f"UPDATE_DEALER_PROBS: Calling prob_panel.update_probabilities...")
+            logger.debug("Updating probabilities for upcard %s", upcard_rank)
             self.prob_panel.update_probabilities(upcard_rank, self.comp_panel)
-            print(f"UPDATE_DEALER_PROBS: Complete")
         else:
-            print("UPDATE_DEALER_PROBS: No hands/upcard yet - clearing display")
+            logger.debug("No upcard yet - clearing probability display")
             self.prob_panel.clear_display()
 
     def _build_dealer_ui(self):
@@ -171,11 +167,6 @@ class DealerPanel(BaseCardPanel):
         y_position = 10  # Fixed vertical position
         canvas.create_window(x_offset, y_position, window=card_frame, anchor='nw')
 
-        # Update canvas scroll region to accommodate cards
-        canvas.configure(scrollregion=canvas.bbox("all"))
-        min_canvas_height = card_height + 20
-        canvas.configure(height=min_canvas_height)
-
         # Scaled font sizes - ADJUSTED for smaller cards
         corner_font_size = max(5, int(7 * size_scale))  # Slightly smaller for legibility
         center_font_size = max(10, int(14 * size_scale))  # Slightly smaller for legibility
@@ -239,11 +230,6 @@ class DealerPanel(BaseCardPanel):
         y_position = 10
         canvas.create_window(x_offset, y_position, window=card_frame, anchor='nw')
 
-        # Update canvas scroll region
-        canvas.configure(scrollregion=canvas.bbox("all"))
-        min_canvas_height = card_height + 20
-        canvas.configure(height=min_canvas_height)
-
         # Scaled font for mystery symbol - ADJUSTED for smaller cards
         mystery_font_size = max(16, int(20 * size_scale))  # Slightly smaller for legibility
         tk.Label(card_frame, text='?', font=('Arial', mystery_font_size, 'bold'),
@@ -265,13 +251,13 @@ class DealerPanel(BaseCardPanel):
 
         self.rank_btns = []
         for ri, r in enumerate(RANKS):
-            display_rank = normalize_rank_display(r)
+            display_rank = _DISPLAY_RANK[r]
             b = tk.Button(
                 btn_row, text=display_rank,
                 width=1 if r != '10' else 2,
                 height=1,
                 font=('Segoe UI', 7),
-                command=lambda rank=r: self.rank_clicked(rank)
+                command=partial(self.rank_clicked, r)
             )
             b.grid(row=0, column=ri, padx=(0 if ri == 0 else 2, 0), pady=0, sticky='w')
             self.rank_btns.append(b)
@@ -313,7 +299,7 @@ class DealerPanel(BaseCardPanel):
 
     def set_play_mode(self):
         """Enable all controls when dealer is hitting during play phase (THIRD PHASE)."""
-        print("DEALER: Setting play mode - enabling all controls for THIRD PHASE")
+        logger.debug("Setting play mode - enabling all controls for THIRD PHASE")
         self.current_deal_step = 2
         self.third_phase_active = True  # NEW: Mark that we're in the third dealing phase
         for btn in self.rank_btns:
@@ -323,27 +309,27 @@ class DealerPanel(BaseCardPanel):
 
     def set_dealer_turn(self, deal_step):
         """Configure controls during the initial dealing phase."""
-        print(f"DEALER: Setting dealer turn for deal step {deal_step}")
+        logger.debug("Setting dealer turn for deal step %s", deal_step)
         self.current_deal_step = deal_step
         self.third_phase_active = False  # NEW: Not in third phase during initial dealing
 
         if deal_step == 0:
-            print("DEALER: Dealing upcard - enabling all rank buttons")
+            logger.debug("Dealing upcard - enabling all rank buttons")
             for btn in self.rank_btns:
                 btn.config(state=tk.NORMAL)
             self.mystery_btn.config(state=tk.DISABLED)
             self.undo_btn.config(state=tk.NORMAL)
 
         elif deal_step == 1:
-            print("DEALER: Dealing hole card")
+            logger.debug("Dealing hole card")
             upcard_is_ace = (self.upcard_rank == 'A')
 
             if upcard_is_ace:
-                print("DEALER: Upcard is Ace - allowing insurance input")
+                logger.debug("Upcard is Ace - allowing insurance input")
                 for btn in self.rank_btns:
                     btn.config(state=tk.NORMAL)
             else:
-                print("DEALER: Upcard is not Ace - disabling rank buttons")
+                logger.debug("Upcard is not Ace - disabling rank buttons")
                 for btn in self.rank_btns:
                     btn.config(state=tk.DISABLED)
 
@@ -352,15 +338,15 @@ class DealerPanel(BaseCardPanel):
 
     def rank_clicked(self, rank):
         """DEALER: Handle rank click."""
-        print(f"DEALER_RANK: {rank}")
+        logger.debug("Rank: %s", rank)
 
         # Block any card inputs once the dealer has stood
         if self.is_done:
-            print("DEALER_RANK: Ignored because dealer is locked")
+            logger.debug("Rank ignored because dealer is locked")
             return
 
         if self.in_hole_phase and not self.hole_card_enabled:
-            print("DEALER_RANK: Ignored during hole card phase")
+            logger.debug("Rank ignored during hole card phase")
             return
 
         if self.current_deal_step == 0:
@@ -369,38 +355,39 @@ class DealerPanel(BaseCardPanel):
             if (len(self.hands[0]) == 1 and
                     not self.hole_card and
                     not self.mystery_hole):
-                print("DEALER_RANK: This is hole card input")
+                logger.debug("Rank is hole card input")
                 self.choose_suit(rank, is_hole=True)
             else:
-                print("DEALER_RANK: This is regular card")
+                logger.debug("Rank is regular card")
                 self.choose_suit(rank, is_hole=False)
         else:
             # THIRD PHASE: treat all rank clicks as regular card inputs
-            print("DEALER_RANK: Third phase input")
+            logger.debug("Rank is third phase input")
             self.choose_suit(rank, is_hole=False)
 
     def choose_suit(self, rank, is_hole=False):
         """Show suit selection for dealer."""
-        print(f"DEALER_SUIT: {rank} (hole={is_hole})")
+        logger.debug("Choose suit for %s (hole=%s)", rank, is_hole)
 
         # Prevent suit selection if dealer is locked
         if self.is_done:
-            print("DEALER_SUIT: Ignored because dealer is locked")
+            logger.debug("Suit choice ignored because dealer is locked")
             return
 
         def on_suit_selected(suit):
-            print(f"DEALER_SUIT_SELECTED: {rank}{suit}")
+            logger.debug("Suit selected: %s%s", rank, suit)
             self.input_card(rank, suit, is_hole)
 
+        from .suit_selection import get_suit_selection  # Deferred until the first click
         get_suit_selection(self, on_suit_selected)
 
     def input_card(self, rank, suit, is_hole=False):
         """DEALER: Input card with hole card support and THIRD PHASE mystery replacement."""
-        print(f"DEALER_INPUT: {rank}{suit} (hole={is_hole})")
+        logger.debug("Input: %s%s (hole=%s)", rank, suit, is_hole)
 
         # Ignore any card input once the dealer has stood
         if self.is_done:
-            print("DEALER_INPUT: Ignored because dealer is locked")
+            logger.debug("Input ignored because dealer is locked")
             return
 
         actual_hole = is_hole or (self.mystery_hole and not is_hole)
@@ -416,18 +403,18 @@ class DealerPanel(BaseCardPanel):
             # with the first real card input.  This ensures the "?" never remains on
             # screen once a value is known.
         if self.mystery_hole and not is_hole:
-            print("DEALER_INPUT: Replacing mystery hole card during play phase")
+            logger.debug("Replacing mystery hole card during play phase")
             self.hole_card = (rank, suit)
             self.mystery_hole = False
             self.on_card(rank, suit, is_hole=True)
             self._history.append({"type": "hole", "rank": rank, "suit": suit})
-            self.update_display()
+            self._schedule_update()
             return
 
         if actual_hole:
             self.hole_card = (rank, suit)
             self.mystery_hole = False
-            print("DEALER_INPUT: Set hole card")
+            logger.debug("Set hole card")
             self.on_card(rank, suit, is_hole=True)
             self._history.append({"type": "hole", "rank": rank, "suit": suit})
         else:
@@ -435,31 +422,31 @@ class DealerPanel(BaseCardPanel):
             # BaseCardPanel.input_card does not track history, so record here
             self._history.append({"type": "card", "rank": rank, "suit": suit})
 
-        self.update_display()
+        self._schedule_update()
 
     def input_mystery_card(self):
         """Input mystery hole card."""
         if self.is_done:
-            print("DEALER_MYSTERY: Ignored because dealer is locked")
+            logger.debug("Mystery card ignored because dealer is locked")
             return
 
         if self.in_hole_phase and len(self.hands[0]) == 1:
             self.mystery_hole = True
             self.hole_card = None
-            print("DEALER_MYSTERY: Added mystery hole card")
+            logger.debug("Added mystery hole card")
             self.on_card("?", "?", is_hole=True)
             self._history.append({"type": "mystery"})
-            self.update_display()
+            self._schedule_update()
 
     def undo(self, hand_idx=None):
         """Undo last dealer input respecting hole card state."""
-        print(f"UNDO: {self.label.cget('text')} undo clicked")
+        logger.debug("Undo clicked")
 
         if hand_idx is None:
             hand_idx = self.current_hand
 
         if not self._history:
-            print("UNDO: Nothing to undo")
+            logger.debug("Nothing to undo")
             return None
 
         last = self._history.pop()
@@ -471,15 +458,15 @@ class DealerPanel(BaseCardPanel):
                 self.is_busted = False
                 self.is_done = False
                 self.on_undo(rank=last_card[0], is_hole=False)
-                print(f"UNDO: Removed {last_card[0]}{last_card[1]}")
+                logger.debug("Undo removed %s%s", last_card[0], last_card[1])
                 card_removed = last_card
             else:
-                print("UNDO: Card history mismatch")
+                logger.warning("Undo card history mismatch")
         elif last.get("type") == "hole":
             self.hole_card = None
             self.is_done = False
             self.on_undo(is_hole=True)
-            print("UNDO: Removed dealer hole card")
+            logger.debug("Undo removed dealer hole card")
             # Restore mystery placeholder if it existed before
             if self._history and self._history[-1].get("type") == "mystery":
                 self.mystery_hole = True
@@ -489,86 +476,113 @@ class DealerPanel(BaseCardPanel):
             if self.mystery_hole:
                 self.mystery_hole = False
                 self.on_undo(is_hole=True)
-                print("UNDO: Removed mystery hole card")
+                logger.debug("Undo removed mystery hole card")
         else:
-            print("UNDO: Unknown history entry")
+            logger.warning("Undo found unknown history entry")
 
-        self.update_display()
+        self._schedule_update()
         return card_removed
 
-    def update_display(self):
-        """UPDATED: Update dealer display with stacked cards and hole card logic."""
-        # Clear existing card widgets
-        for hand_widgets in self.card_widgets:
-            for widget in hand_widgets:
-                try:
-                    widget.destroy()
-                except:
-                    pass
+    def _schedule_update(self):
+        """Queue one idle-time redraw for a burst of card inputs."""
+        if not self._update_pending:
+            self._update_pending = True
+            self.after_idle(self._do_update)
+
+    def _do_update(self):
+        """Run the redraw queued by _schedule_update()."""
+        if self._update_pending:
+            self.update_display()
 
-        self.card_widgets = []
+    def update_display(self):
+        """UPDATED: Update dealer display with stacked cards and hole card logic.
 
+        Cards appended since the last redraw (the usual hit) are added on
+        their own; any other change rebuilds the stack.
+        """
+        self._update_pending = False  # a direct call covers any queued redraw
         if not self.displays:
             return
 
         canvas = self.displays[0]
-        self.card_widgets.append([])
-
-        # Clear canvas
-        canvas.delete("all")
+        slots = self._card_slots()
+        shown = self._displayed_slots
 
         # Card scale and stacking offset - UPDATED for smaller cards (20% reduction)
         card_scale = 1.6  # Reduced from 2.0
         stack_offset = int(18 * card_scale)  # Adjust offset proportionally (was 22)
-        current_x = 10
+
+        if slots != shown:
+            if slots[:len(shown)] == shown:
+                start_idx = len(shown)
+            else:
+                # A card was removed or replaced (undo, hole reveal, reset).
+                # Unmapping is enough for this redraw; the old frames are
+                # destroyed together once Tk is idle.
+                stale, self.card_widgets[0] = self.card_widgets[0], []
+                canvas.delete("all")
+                if stale:
+                    self.after_idle(self._destroy_card_widgets, stale)
+                start_idx = 0
+
+            for slot_idx in range(start_idx, len(slots)):
+                slot = slots[slot_idx]
+                x = 10 + slot_idx * stack_offset
+                if slot[0] == 'mystery':
+                    widget = self.create_stacked_mystery_widget(canvas, x, card_scale)
+                else:
+                    widget = self.create_stacked_card_widget(slot[1], slot[2], canvas, x, card_scale)
+                self.card_widgets[0].append(widget)
+            self._displayed_slots = slots
+
+            # Update canvas width to fit all cards - ADJUSTED for smaller cards
+            current_x = 10 + len(slots) * stack_offset
+            total_width = current_x + int(50 * card_scale)  # Adjust for smaller card base width
+            if current_x > 10:
+                # Size the canvas once for the whole hand instead of once per card;
+                # every configure() re-runs geometry propagation up the widget tree.
+                canvas.configure(width=min(total_width, 400),  # Reduced max width proportionally (was 500)
+                                 height=int(70 * card_scale) + 20,
+                                 scrollregion=canvas.bbox("all"))
+            else:
+                canvas.configure(width=min(total_width, 400))
+
+        # Update score and status
+        self._update_score_display()
+        self._update_status_display()
+
+    @staticmethod
+    def _destroy_card_widgets(widgets):
+        """Destroy card frames retired by update_display() in one idle pass."""
+        for widget in widgets:
+            widget.destroy()  # Tk ignores windows that are already gone
+
+    def _card_slots(self):
+        """Cards to show left to right: ('card', rank, suit) or ('mystery',)."""
+        hand = self.hands[0]
+        slots = []
 
         # Show upcard (first card)
-        if self.hands[0]:
-            upcard = self.hands[0][0]
-            card_widget = self.create_stacked_card_widget(upcard[0], upcard[1], canvas, current_x, card_scale)
-            self.card_widgets[0].append(card_widget)
-            current_x += stack_offset
+        if hand:
+            slots.append(('card', hand[0][0], hand[0][1]))
 
         # Show hole card (second card)
         if self.mystery_hole:
-            mystery_widget = self.create_stacked_mystery_widget(canvas, current_x, card_scale)
-            self.card_widgets[0].append(mystery_widget)
-            current_x += stack_offset
+            slots.append(('mystery',))
             start_idx = 2
         elif self.hole_card:
-            hole_widget = self.create_stacked_card_widget(
-                self.hole_card[0],
-                self.hole_card[1],
-                canvas,
-                current_x,
-                card_scale,
-            )
-            self.card_widgets[0].append(hole_widget)
-            current_x += stack_offset
+            slots.append(('card', self.hole_card[0], self.hole_card[1]))
             start_idx = 1
-        elif len(self.hands[0]) > 1:
-            mystery_widget = self.create_stacked_mystery_widget(canvas, current_x, card_scale)
-            self.card_widgets[0].append(mystery_widget)
-            current_x += stack_offset
+        elif len(hand) > 1:
+            slots.append(('mystery',))
             start_idx = 2
         else:
             start_idx = 1
 
         # Show any additional cards (hits) with stacking
-        if len(self.hands[0]) > start_idx:
-            for i in range(start_idx, len(self.hands[0])):
-                card = self.hands[0][i]
-                card_widget = self.create_stacked_card_widget(card[0], card[1], canvas, current_x, card_scale)
-                self.card_widgets[0].append(card_widget)
-                current_x += stack_offset
-
-        # Update canvas width to fit all cards - ADJUSTED for smaller cards
-        total_width = current_x + int(50 * card_scale)  # Adjust for smaller card base width
-        canvas.configure(width=min(total_width, 400))  # Reduced max width proportionally (was 500)
-
-        # Update score and status
-        self._update_score_display()
-        self._update_status_display()
+        for rank, suit in hand[start_idx:]:
+            slots.append(('card', rank, suit))
+        return slots
 
     def _update_score_display(self):
         """Update dealer score display."""
@@ -638,7 +652,7 @@ class DealerPanel(BaseCardPanel):
         self.hole_card_enabled = True
         self.in_hole_phase = False
         self.mystery_hole = False
-        print("DEALER_REVEAL: Enabled hole card input")
+        logger.debug("Enabled hole card input")
 
     def set_enabled(self, enabled, hole_phase=False):
         """Enable/disable dealer controls."""
@@ -665,4 +679,4 @@ class DealerPanel(BaseCardPanel):
         self.upcard_rank = None
         self.third_phase_active = False  # NEW: Reset third phase tracking
         self._history = []
-        self.update_display()
\ No newline at end of file
+        self._schedule_update()
\ No newline at end of file
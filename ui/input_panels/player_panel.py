@@ -1,12 +1,90 @@
+import logging
 import tkinter as tk
-import sys
-import os
-
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from contextlib import contextmanager
+from functools import lru_cache, partial
 
 from constants import RANKS, COLORS, normalize_rank_display
 from .base_card_panel import BaseCardPanel
-from .suit_selection import get_suit_selection
+
+logger = logging.getLogger(__name__)
+
+# Hand displays built up front so a split only has to show one
+_PREALLOCATED_HAND_DISPLAYS = 4
+
+# Shared rank/undo button styling; (rank, label, width) per rank button
+_RANK_SPECS = tuple((r, normalize_rank_display(r), 2 if r == '10' else 1) for r in RANKS)
+_BTN_FONT = ('Segoe UI', 7)
+_BTN_GRID = dict(row=0, pady=0, ipadx=0, ipady=0, sticky='w')
+
+# Action button styles (STAND / SPLIT / RESET)
+_ACTION_FONT = ('Segoe UI', 9, 'bold')
+_STAND_KW = dict(width=6, height=1, font=_ACTION_FONT, bg='#ff6666', fg='white')
+_SPLIT_KW = dict(width=6, height=1, font=_ACTION_FONT, bg='#66ff66', fg='black')
+_RESET_KW = dict(width=6, height=1, font=_ACTION_FONT, bg='#ffaa00', fg='white')
+
+# Suit symbol/color lookups shared by every stacked card
+_SUIT_SYMBOLS = {'S': '♠', 'C': '♣', 'H': '♥', 'D': '♦'}
+_SUIT_COLORS = {'♠': 'black', '♣': 'black', '♥': 'red', '♦': 'red'}
+
+# Rank groups used when drawing card faces
+_FACE_RANKS = frozenset(('J', 'Q', 'K'))
+_TEN_RANKS = frozenset(('T', '10'))
+
+# Split comparison value per rank (all ten-value cards split with each other)
+_SPLIT_VAL = {'A': 11, '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9,
+              'T': 10, '10': 10, 'J': 10, 'Q': 10, 'K': 10}
+
+
+def _build_card_metrics(size_scale):
+    """Pixel sizes and font tuples for a stacked card drawn at ``size_scale``."""
+    face_font = ('Arial', max(8, int(12 * size_scale)), 'bold')
+    corner_font = ('Arial', max(3, int(5 * size_scale)), 'bold')
+    return {
+        'card_width': int(45 * size_scale),
+        'card_height': int(65 * size_scale),
+        'center_font': ('Arial', max(6, int(10 * size_scale)), 'bold'),
+        'face_center_fonts': {'J': face_font, 'Q': face_font, 'K': face_font,
+                              'A': ('Arial', max(11, int(16 * size_scale)), 'bold')},
+        'corner_x': max(1, int(2 * size_scale)),
+        'corner_y': max(1, int(2 * size_scale)),
+        'corner_offset': max(-1, int(-2 * size_scale)),
+        # Canvas item option templates shared by every card at this scale
+        'top_left_kw': {'font': corner_font, 'anchor': tk.NW, 'justify': tk.LEFT},
+        'bottom_right_kw': {'font': corner_font, 'anchor': tk.SE, 'justify': tk.RIGHT},
+    }
+
+
+_CARD_BG_KW = {'fill': 'white', 'outline': 'black', 'width': 1}
+
+
+def _card_coords(x_offset, metrics):
+    """Canvas coordinates of a stacked card's (bg, tl, ctr, br) items at ``x_offset``."""
+    card_width = metrics['card_width']
+    card_height = metrics['card_height']
+    corner_offset = metrics['corner_offset']
+    return (
+        (x_offset, 0, x_offset + card_width - 1, card_height - 1),
+        (x_offset + metrics['corner_x'], metrics['corner_y']),
+        (x_offset + card_width // 2, card_height // 2),
+        (x_offset + card_width + corner_offset, card_height + corner_offset),
+    )
+
+
+@lru_cache(maxsize=None)
+def _card_face(rank, suit):
+    """Corner texts, center text and color shown for ``rank``/``suit`` (cached per card)."""
+    suit_symbol = _SUIT_SYMBOLS.get(suit, suit)
+    display_rank = '10' if rank in _TEN_RANKS else rank
+
+    # Center shows the rank for face cards, the suit symbol otherwise
+    center_text = rank if rank in _FACE_RANKS else suit_symbol
+
+    return (f"{display_rank}\n{suit_symbol}", center_text, f"{suit_symbol}\n{display_rank}",
+            _SUIT_COLORS.get(suit_symbol, 'black'))
+
+
+# Precomputed for the two scales update_display() uses (split / single hand)
+_CARD_METRICS = {scale: _build_card_metrics(scale) for scale in (0.6, 1.6)}
 
 
 class PlayerPanel(BaseCardPanel):
@@ -15,6 +93,9 @@ class PlayerPanel(BaseCardPanel):
     def __init__(self, parent, on_card, on_undo, on_action=None, on_global_undo=None, undo_manager=None):
         super().__init__(parent, "PLAYER", is_player=True, is_dealer=False,
                          on_card=on_card, on_undo=on_undo)
+        # Panel colors, looked up once
+        self._bg = COLORS['fg_player']
+        self._fg_white = COLORS['fg_white']
         self.on_action = on_action
         self.on_global_undo = on_global_undo
         self.undo_manager = undo_manager
@@ -23,25 +104,58 @@ class PlayerPanel(BaseCardPanel):
         self.split_history = set()
         self.hand_labels = []  # store labels for each hand container
 
+        # Split dealing and game phase state (read on every redraw)
+        self.pending_split = False
+        self.pending_index = 0
+        self.play_phase = True
+
+        # Redraw batching: update_display() calls made inside batch_updates()
+        # are deferred and collapsed into a single redraw on exit.
+        self._batch_depth = 0
+        self._redraw_deferred = False
+
+        # Coalesced redraw: bursts of state changes share one idle-time update_display()
+        self._pending_redraw = False
+        self._pending_dirty_hand = None
+        self._redraw_after_id = None
+
+        # Card pool per hand display: each entry is the canvas item dict
+        # returned by create_stacked_card_widget(). Cards are reconfigured in
+        # place and only the delta is created/deleted on redraw.
+        self._card_pool = []
+        self._last_rendered_hands = []  # hand tuples the pool currently shows
+        self._pool_scale = None
+
+        # Hand containers are created once and shown/hidden as hands come and go
+        self._hand_containers = []
+        self._visible_hand_count = 0
+
+        # Last options pushed to Tk per widget (see _set_if_changed)
+        self._widget_cache = {}
+        # Button states only change on state transitions; redraws skip them otherwise
+        self._button_state_dirty = True
+        self._enabled_state = None  # last set_enabled() value
+
         self._build_player_ui()
 
     def _build_player_ui(self):
         """Build player-specific UI with UPDATED stacked card display."""
         # Panel background
-        panel_color = COLORS['fg_player']
+        panel_color = self._bg
         self.configure(bg=panel_color)
 
         # Header
         self.label = tk.Label(
             self, text="PLAYER",
             font=('Segoe UI', 10, 'bold'),
-            bg=panel_color, fg=COLORS['fg_white']
+            bg=panel_color, fg=self._fg_white
         )
         self.label.pack(anchor='w', padx=2, pady=(2, 0))  # align to left edge
 
         # Status display
+        self.status_var = tk.StringVar(self, value="")
         self.status_label = tk.Label(
-            self, text="",
+            self, textvariable=self.status_var,
             font=('Segoe UI', 8),
             bg=panel_color, fg='#ff4444'
         )
@@ -55,51 +169,67 @@ class PlayerPanel(BaseCardPanel):
         self.card_center_container = tk.Frame(self.display_frame, bg=panel_color)
         self.card_center_container.pack(anchor='w', expand=True)
 
-        self._add_hand_display()
+        for _ in range(_PREALLOCATED_HAND_DISPLAYS):
+            self._add_hand_display()
+        self._show_hand_displays(1)
 
         # Input buttons, score, and action buttons
         self._build_input_row()
 
     def _add_hand_display(self):
-        """Add container for a hand with stacked cards."""
-        hand_container = tk.Frame(self.card_center_container, bg=COLORS['fg_player'], height=80)
-        hand_container.pack(anchor='w', pady=(10, 0), fill='x')
+        """Add a (hidden) container for a hand with stacked cards."""
+        hand_container = tk.Frame(self.card_center_container, bg=self._bg, height=80)
         label = tk.Label(hand_container, text="", font=('Segoe UI', 8, 'bold'),
-                         bg=COLORS['fg_player'], fg='#cccccc')
+                         bg=self._bg, fg='#cccccc')
         label.pack(side='top', anchor='w', padx=2, pady=(0, 2))
 
-        card_area = tk.Frame(hand_container, bg=COLORS['fg_player'], height=80)
+        # Cards are drawn as items on one canvas per hand; the canvas is sized
+        # explicitly in update_display().
+        card_area = tk.Canvas(hand_container, bg=self._bg, highlightthickness=0, height=80)
         card_area.pack(anchor='w', pady=0)
 
+        self._hand_containers.append(hand_container)
         self.displays.append(card_area)
         self.hand_labels.append(label)
-        self.card_widgets.append([])
+        self._card_pool.append([])
+        self._last_rendered_hands.append(None)
+
+    def _show_hand_displays(self, count):
+        """Show the first ``count`` hand containers and hide the rest."""
+        while len(self._hand_containers) < count:
+            self._add_hand_display()
+        # One grid row per hand: showing or hiding a hand only relayouts its own row
+        for i in range(self._visible_hand_count, count):
+            self._hand_containers[i].grid(row=i, column=0, sticky='ew', pady=(10, 0))
+        for i in range(count, self._visible_hand_count):
+            self._hand_containers[i].grid_remove()
+        self._visible_hand_count = count
 
     def _build_input_row(self):
         """Build rank input buttons and REPOSITIONED score display."""
-        bottom_frame = tk.Frame(self, bg=COLORS['fg_player'])
+        bottom_frame = tk.Frame(self, bg=self._bg)
         bottom_frame.pack(fill='x', pady=2)
 
         # Create horizontal container for buttons and score
-        input_container = tk.Frame(bottom_frame, bg=COLORS['fg_player'])
+        input_container = tk.Frame(bottom_frame, bg=self._bg)
         input_container.pack(side=tk.LEFT, anchor='w', padx=0)
 
         # Rank buttons
-        btn_row = tk.Frame(input_container, bg=COLORS['fg_player'])
+        btn_row = tk.Frame(input_container, bg=self._bg)
         btn_row.pack(side=tk.LEFT, anchor='w', padx=0)
 
         self.rank_btns = []
-        for ri, r in enumerate(RANKS):
-            display_rank = normalize_rank_display(r)
+        for ri, (r, display_rank, width) in enumerate(_RANK_SPECS):
             b = tk.Button(
                 btn_row, text=display_rank,
-                width=1 if r != '10' else 2,
+                width=width,
                 height=1,
-                font=('Segoe UI', 7),
+                font=_BTN_FONT,
                 bd=1,
-                command=lambda rank=r: self.rank_clicked(rank)
+                takefocus=0,
+                command=partial(self.rank_clicked, r)
             )
-            b.grid(row=0, column=ri, padx=(0 if ri == 0 else 2, 0), pady=0, ipadx=0, ipady=0, sticky='w')
+            b.grid(column=ri, padx=(0 if ri == 0 else 2, 0), **_BTN_GRID)
             self.rank_btns.append(b)
 
         # GLOBAL UNDO button
@@ -109,54 +239,41 @@ class PlayerPanel(BaseCardPanel):
             height=1,
             font=('Segoe UI', 7, 'bold'),
             bd=1,
+            takefocus=0,
             command=self._global_undo
         )
-        self.undo_btn.grid(row=0, column=len(RANKS), padx=(2, 0), pady=0, ipadx=0, ipady=0, sticky='w')
+        self.undo_btn.grid(column=len(RANKS), padx=(2, 0), **_BTN_GRID)
 
         # UPDATED: Score display positioned immediately to the right of rank buttons
+        self.score_var = tk.StringVar(self, value="")
         self.score_label = tk.Label(
-            input_container, text="",
+            input_container, textvariable=self.score_var,
             font=('Segoe UI', 10, 'bold'),  # Slightly larger font for better visibility
-            bg=COLORS['fg_player'], fg='#ffff00',
+            bg=self._bg, fg='#ffff00',
             width=10, anchor='center',  # Reduced width to fit better
             relief=tk.SUNKEN, bd=1  # Added visual separation
         )
         self.score_label.pack(side=tk.LEFT, padx=(10, 0))  # Position immediately to the right with 10px spacing
 
         # Action buttons (moved to new row to prevent crowding)
-        action_row = tk.Frame(self, bg=COLORS['fg_player'])
+        action_row = tk.Frame(self, bg=self._bg)
         action_row.pack(anchor='w', pady=(0, 2))
 
         self.stand_skip_btn = tk.Button(
-            action_row, text='STAND',
-            width=6,
-            height=1,
-            font=('Segoe UI', 9, 'bold'),
-            bg='#ff6666',
-            fg='white',
+            action_row, text='STAND', **_STAND_KW,
             command=self._handle_stand_skip
         )
         self.stand_skip_btn.pack(side=tk.LEFT, padx=2)
 
         self.split_btn = tk.Button(
-            action_row, text='SPLIT',
-            width=6,
-            height=1,
-            font=('Segoe UI', 9, 'bold'),
-            bg='#66ff66',
-            fg='black',
-            command=lambda: self._action('split')
+            action_row, text='SPLIT', **_SPLIT_KW,
+            command=partial(self._action, 'split')
         )
         self.split_btn.pack(side=tk.LEFT, padx=2)
 
         # Reset button
         self.reset_btn = tk.Button(
-            action_row, text='RESET',
-            width=6,
-            height=1,
-            font=('Segoe UI', 9, 'bold'),
-            bg='#ffaa00',
-            fg='white',
+            action_row, text='RESET', **_RESET_KW,
             command=self._handle_reset
         )
         self.reset_btn.pack(side=tk.LEFT, padx=2)
@@ -166,212 +283,259 @@ class PlayerPanel(BaseCardPanel):
 
     def _handle_reset(self):
         """Handle reset button - resets the player panel."""
-        print("PLAYER: Reset clicked - resetting player panel")
+        logger.debug("Reset clicked - resetting player panel")
         self.reset()
 
     def create_stacked_card_widget(self, rank, suit, parent, x_offset, size_scale=0.8):  # REDUCED: 0.6 for splits, 1.6 for single becomes 0.48 and 1.28 (20% reduction)
-        """Create a single card widget positioned for stacking with 20% smaller size."""
-        # Base dimensions with scaling - REDUCED by 20%
-        base_width = 45
-        base_height = 65
-
-        card_width = int(base_width * size_scale)
-        card_height = int(base_height * size_scale)
-
-        # Create main card frame
-        card_frame = tk.Frame(parent,
-                              bg='white',
-                              relief=tk.SOLID,
-                              bd=1,
-                              width=card_width,
-                              height=card_height)
-        card_frame.pack_propagate(False)
-
-        # Position using place() for stacking
-        card_frame.place(x=x_offset, y=0)
-
-        # Determine suit color and symbol
-        suit_colors = {'♠': 'black', '♣': 'black', '♥': 'red', '♦': 'red'}
-        suit_symbols = {'S': '♠', 'C': '♣', 'H': '♥', 'D': '♦'}
-
-        suit_symbol = suit_symbols.get(suit, suit)
-        suit_color = suit_colors.get(suit_symbol, 'black')
-        display_rank = '10' if rank in ['T', '10'] else rank
-
-        # Scaled font sizes - ADJUSTED for smaller cards
-        corner_font_size = max(3, int(5 * size_scale))  # Slightly smaller for legibility
-        center_font_size = max(6, int(10 * size_scale))  # Slightly smaller for legibility
-
-        if rank in ['J', 'Q', 'K']:
-            center_font_size = max(8, int(12 * size_scale))  # Slightly smaller for legibility
-        elif rank == 'A':
-            center_font_size = max(11, int(16 * size_scale))  # Slightly smaller for legibility
-
-        # Top-left corner: rank and suit (ALWAYS VISIBLE for stacking)
-        top_left = tk.Label(card_frame,
-                            text=f"{display_rank}\n{suit_symbol}",
-                            font=('Arial', corner_font_size, 'bold'),
-                            fg=suit_color,
-                            bg='white',
-                            justify=tk.LEFT)
-        corner_x = max(1, int(2 * size_scale))
-        corner_y = max(1, int(2 * size_scale))
-        top_left.place(x=corner_x, y=corner_y)
-
-        # Center: Large suit symbol(s)
-        if rank in ['J', 'Q', 'K']:
-            center_text = rank
-        elif rank == 'A':
-            center_text = suit_symbol
-        elif rank in ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'T']:
-            center_text = suit_symbol
-        else:
-            center_text = suit_symbol
-
-        center_label = tk.Label(card_frame,
-                                text=center_text,
-                                font=('Arial', center_font_size, 'bold'),
-                                fg=suit_color,
-                                bg='white')
-        center_label.place(relx=0.5, rely=0.5, anchor=tk.CENTER)
-
-        # Bottom-right corner: rank and suit (upside down)
-        bottom_right = tk.Label(card_frame,
-                                text=f"{suit_symbol}\n{display_rank}",
-                                font=('Arial', corner_font_size, 'bold'),
-                                fg=suit_color,
-                                bg='white',
-                                justify=tk.RIGHT)
-        corner_offset = max(-1, int(-2 * size_scale))
-        bottom_right.place(relx=1, rely=1, anchor=tk.SE, x=corner_offset, y=corner_offset)
-
-        return card_frame
+        """Draw a stacked card on the ``parent`` canvas and return its item ids for reuse."""
+        metrics = _CARD_METRICS.get(size_scale) or _build_card_metrics(size_scale)
+        bg_xy, tl_xy, ctr_xy, br_xy = _card_coords(x_offset, metrics)
+        tl_text, center_text, br_text, color = _card_face(rank, suit)
+
+        # Items are created at their final position and text - no follow-up configure
+        return {
+            # Card face
+            'bg': parent.create_rectangle(*bg_xy, **_CARD_BG_KW),
+            # Top-left corner: rank and suit (ALWAYS VISIBLE for stacking)
+            'tl': parent.create_text(*tl_xy, text=tl_text, fill=color, **metrics['top_left_kw']),
+            # Center: Large suit symbol or face rank
+            'ctr': parent.create_text(*ctr_xy, text=center_text, fill=color, anchor=tk.CENTER,
+                                      font=metrics['face_center_fonts'].get(rank, metrics['center_font'])),
+            # Bottom-right corner: rank and suit (upside down)
+            'br': parent.create_text(*br_xy, text=br_text, fill=color, **metrics['bottom_right_kw']),
+        }
+
+    def _configure_stacked_card(self, canvas, card, rank, suit, x_offset, size_scale):
+        """Show ``rank``/``suit`` on an existing stacked card and move it to ``x_offset``."""
+        metrics = _CARD_METRICS.get(size_scale) or _build_card_metrics(size_scale)
+        bg_xy, tl_xy, ctr_xy, br_xy = _card_coords(x_offset, metrics)
+        tl_text, center_text, br_text, color = _card_face(rank, suit)
+
+        # Stacking is just the x coordinate of the card's items
+        canvas.coords(card['bg'], *bg_xy)
+        canvas.coords(card['tl'], *tl_xy)
+        canvas.coords(card['ctr'], *ctr_xy)
+        canvas.coords(card['br'], *br_xy)
+
+        canvas.itemconfig(card['tl'], text=tl_text, fill=color)
+        canvas.itemconfig(card['ctr'], text=center_text,
+                          font=metrics['face_center_fonts'].get(rank, metrics['center_font']),
+                          fill=color)
+        canvas.itemconfig(card['br'], text=br_text, fill=color)
 
     def _action(self, action):
         """Handle action button clicks."""
-        print(f"PLAYER_ACTION: {action}")
+        logger.debug("Action: %s", action)
         if self.on_action:
             self.on_action(action, self.current_hand)
 
     def _handle_stand_skip(self):
         """Handle the unified Stand/Skip button."""
-        if getattr(self, 'play_phase', True):
-            print("PLAYER: Stand action in play phase")
+        if self.play_phase:
+            logger.debug("Stand action in play phase")
             self._action('stand')
         else:
-            print("PLAYER: Skip action in dealing phase")
+            logger.debug("Skip action in dealing phase")
             self._action('skip')
 
     def _global_undo(self):
         """GLOBAL UNDO - delegates to main app's shared undo handler."""
-        print("PLAYER: Global undo triggered")
+        logger.debug("Global undo triggered")
         if self.on_global_undo:
             self.on_global_undo()
         else:
-            print("PLAYER: No global undo handler available")
+            logger.warning("No global undo handler available")
 
     def update_mode(self, play_phase=True):
         """Update UI mode based on current game phase."""
+        if play_phase == self.play_phase:
+            return
         self.play_phase = play_phase
         self._update_action_buttons()
-        print(f"PLAYER: Updated mode to {'play' if play_phase else 'dealing'} phase")
+        logger.debug("Updated mode to %s phase", 'play' if play_phase else 'dealing')
 
     def input_card(self, rank, suit, is_hole=False):
         """Player card input with correct split dealing logic."""
-        print(f"PLAYER_INPUT: {rank}{suit}")
+        logger.debug("Input: %s%s", rank, suit)
+        self._button_state_dirty = True
 
         # If we're in the middle of a split, route the input to the correct hand!
-        if getattr(self, "pending_split", False):
-            target = self.pending_index
-            if self.undo_manager:
-                self.undo_manager.record_action(
-                    "player", rank, suit,
-                    hand_idx=target,
-                    is_hole=is_hole
-                )
-            self.hands[target].append((rank, suit))
-            if self.on_card:
-                self.on_card(rank, suit, is_hole)
-
-            self.pending_index += 1
-            if self.pending_index >= len(self.hands):
-                # Done dealing 1 card to each split hand
-                self.pending_split = False
-                self.pending_index = 0
-                self.current_hand = 0  # Start play phase at hand 1
-            else:
-                self.current_hand = self.pending_index
-
-            self.update_display()
+        if self.pending_split:
+            with self.batch_updates():
+                target = self.pending_index
+                if self.undo_manager:
+                    self.undo_manager.record_action(
+                        "player", rank, suit,
+                        hand_idx=target,
+                        is_hole=is_hole
+                    )
+                self.hands[target].append((rank, suit))
+                if self.on_card:
+                    self.on_card(rank, suit, is_hole)
+
+                self.pending_index += 1
+                if self.pending_index >= len(self.hands):
+                    # Done dealing 1 card to each split hand - one redraw for all of them
+                    self.pending_split = False
+                    self.pending_index = 0
+                    self.current_hand = 0  # Start play phase at hand 1
+                    self._schedule_update_display()
+                else:
+                    # Intermediate split card: only keep the score current
+                    self.current_hand = self.pending_index
+                    self._update_score_display()
             return
 
         # Normal card input (non-split)
+        target = self.current_hand
         if self.undo_manager:
             self.undo_manager.record_action(
                 "player", rank, suit,
-                hand_idx=self.current_hand,
+                hand_idx=target,
                 is_hole=is_hole
             )
         super().input_card(rank, suit, is_hole)
-        self.update_display()
+        self._schedule_update_display(dirty_hand=target)
+
+    @contextmanager
+    def batch_updates(self):
+        """Defer update_display() calls until the outermost batch exits."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._redraw_deferred:
+                self._redraw_deferred = False
+                self.update_display()
 
-    def update_display(self):
-        """Update player display with stacked cards."""
-        # Clear existing card widgets
-        for hand_widgets in self.card_widgets:
-            for widget in hand_widgets:
-                try:
-                    widget.destroy()
-                except Exception:
-                    pass
+    def _schedule_update_display(self, dirty_hand=None):
+        """Queue one idle-time update_display() for a burst of state changes.
+
+        Action buttons are refreshed right away since keyboard shortcuts read
+        their state synchronously.
+        """
+        if not self._pending_redraw:
+            self._pending_redraw = True
+            self._pending_dirty_hand = dirty_hand
+            self._redraw_after_id = self.after_idle(self._flush_update_display)
+        elif self._pending_dirty_hand != dirty_hand:
+            # Different hands touched in the same burst - repaint them all
+            self._pending_dirty_hand = None
+        if self._button_state_dirty:
+            self._update_action_buttons()
+
+    def _flush_update_display(self):
+        """Run the redraw queued by _schedule_update_display()."""
+        if not self._pending_redraw:
+            return  # Already drawn by a direct update_display() call
+        self._redraw(dirty_hand=self._pending_dirty_hand)
+
+    def update_display(self, dirty_hand=None):
+        """Update player display with stacked cards, reusing pooled card items.
+
+        ``dirty_hand`` limits the card repaint to that hand when only it has
+        changed; ``None`` repaints every hand. Callers outside the panel
+        change its state directly before calling this, so the action buttons
+        are re-evaluated as well.
+        """
+        self._button_state_dirty = True
+        self._redraw(dirty_hand)
+
+    def _redraw(self, dirty_hand=None):
+        """Repaint cards, score and status; action buttons only when flagged dirty."""
+        if self._batch_depth:
+            self._redraw_deferred = True
+            return
 
-        self.card_widgets = []
+        if self._pending_redraw:
+            # This redraw covers the queued one
+            if self._pending_dirty_hand != dirty_hand:
+                dirty_hand = None
+            self._pending_redraw = False
+            self._pending_dirty_hand = None
+            if self._redraw_after_id is not None:
+                self.after_cancel(self._redraw_after_id)
+                self._redraw_after_id = None
 
         # UPDATED: Determine card scale based on number of hands - REDUCED by 20%
         card_scale = 0.6 if len(self.hands) > 1 else 1.6  # Reduced from 0.75/2.0 to 0.6/1.6 (20% reduction)
         stack_offset = int(18 * (card_scale / 1.6))  # Adjust offset proportionally (was 22 * scale/2.0)
-        print(f"PLAYER: Using card scale {card_scale} for {len(self.hands)} hands")
-
-        # Update each hand
-        for i, hand in enumerate(self.hands):
-            if i >= len(self.displays):
-                self._add_hand_display()
 
-            card_area = self.displays[i]
-            label = self.hand_labels[i]
-            self.card_widgets.append([])
-
-            # Clear card area
-            for child in card_area.winfo_children():
-                child.destroy()
-
-            # Hand label
-            if len(self.hands) > 1:
-                split_status = " (No Resplit)" if i in self.split_history else ""
-                arrow = " ←" if i == self.current_hand else ""
-                label_text = f"Hand {i + 1}{arrow}{split_status}"
-                label.config(text=label_text,
-                             fg='#ffff00' if i == self.current_hand else '#cccccc')
-            else:
-                label.config(text="")
+        if card_scale != self._pool_scale:
+            # Card size changed (split or reset) - pooled cards must be rebuilt
+            for i in range(len(self._card_pool)):
+                self._clear_hand_cards(i)
+            self._pool_scale = card_scale
+            dirty_hand = None
 
-            # UPDATED: Position cards with better spacing and layout for smaller cards
-            current_x = 0
-
-            for card_idx, (rank, suit) in enumerate(hand):
-                card_widget = self.create_stacked_card_widget(rank, suit, card_area, current_x, card_scale)
-                self.card_widgets[i].append(card_widget)
-                current_x += stack_offset
-
-            # Size card area to fit cards - ADJUSTED for smaller cards
-            card_width = int(45 * card_scale)
-            total_width = card_width + (len(hand) - 1) * stack_offset if hand else card_width
-            card_area.configure(width=total_width, height=int(65 * card_scale) + 10)
+        if (dirty_hand is not None and dirty_hand < len(self.hands)
+                and len(self.hands) == self._visible_hand_count):
+            self._render_hand(dirty_hand, card_scale, stack_offset)
+        else:
+            # Update each hand; displays beyond the hand count are just hidden
+            # and their pooled cards are diffed again if they are shown later
+            self._show_hand_displays(len(self.hands))
+            for i in range(len(self.hands)):
+                self._render_hand(i, card_scale, stack_offset)
 
         # Update score and status
         self._update_score_display()
         self._update_status_display()
-        self._update_action_buttons()
+        if self._button_state_dirty:
+            self._update_action_buttons()
+
+    def _render_hand(self, i, card_scale, stack_offset):
+        """Repaint the label and stacked cards of hand ``i``."""
+        hand = self.hands[i]
+        card_area = self.displays[i]
+        label = self.hand_labels[i]
+
+        # Hand label
+        if len(self.hands) > 1:
+            split_status = " (No Resplit)" if i in self.split_history else ""
+            arrow = " ←" if i == self.current_hand else ""
+            label_text = f"Hand {i + 1}{arrow}{split_status}"
+            self._set_if_changed(label, text=label_text,
+                                 fg='#ffff00' if i == self.current_hand else '#cccccc')
+        else:
+            self._set_if_changed(label, text="")
+
+        rendered = tuple(hand)
+        previous = self._last_rendered_hands[i]
+        if rendered == previous:
+            return
+        self._last_rendered_hands[i] = rendered
+
+        # Only create/destroy the difference; reuse the rest of the pool
+        pool = self._card_pool[i]
+        while len(pool) > len(hand):
+            card_area.delete(*pool.pop().values())
+
+        # UPDATED: Position cards with better spacing and layout for smaller cards
+        current_x = 0
+
+        for card_idx, (rank, suit) in enumerate(hand):
+            if card_idx >= len(pool):
+                pool.append(self.create_stacked_card_widget(rank, suit, card_area, current_x, card_scale))
+            elif previous is None or card_idx >= len(previous) or previous[card_idx] != (rank, suit):
+                self._configure_stacked_card(card_area, pool[card_idx], rank, suit, current_x, card_scale)
+            current_x += stack_offset
+
+        # Size card area to fit cards - ADJUSTED for smaller cards
+        metrics = _CARD_METRICS.get(card_scale) or _build_card_metrics(card_scale)
+        card_width = metrics['card_width']
+        total_width = card_width + (len(hand) - 1) * stack_offset if hand else card_width
+        # Resizing the canvas re-runs geometry propagation; skip it when unchanged
+        self._set_if_changed(card_area, width=total_width, height=metrics['card_height'] + 10)
+
+    def _clear_hand_cards(self, hand_idx):
+        """Delete the pooled card items of one hand display."""
+        card_area = self.displays[hand_idx]
+        for card in self._card_pool[hand_idx]:
+            card_area.delete(*card.values())
+        self._card_pool[hand_idx] = []
+        self._last_rendered_hands[hand_idx] = None
 
     def _update_score_display(self):
         """Update player score display."""
@@ -379,45 +543,63 @@ class PlayerPanel(BaseCardPanel):
             if len(self.hands) > 1:
                 # Split hands - show current hand score
                 current_score = self.get_score_display(self.current_hand)
-                self.score_label.config(text=f"H{self.current_hand + 1}: {current_score}")
+                score_text = f"H{self.current_hand + 1}: {current_score}"
             else:
                 # Single hand
                 score_text = self.get_score_display()
-                self.score_label.config(text=score_text)
         else:
-            self.score_label.config(text="")
+            score_text = ""
+
+        if score_text != self.score_var.get():
+            self.score_var.set(score_text)
 
     def _update_status_display(self):
         """Update player status display."""
         if self.is_surrendered:
-            self.status_label.config(text="SURRENDERED")
+            status_text = "SURRENDERED"
         elif self.is_busted:
-            self.status_label.config(text="BUST")
+            status_text = "BUST"
         elif self.is_done:
-            self.status_label.config(text="STAND")
+            status_text = "STAND"
         else:
-            self.status_label.config(text="")
+            status_text = ""
+
+        if status_text != self.status_var.get():
+            self.status_var.set(status_text)
 
     def _update_action_buttons(self):
         """Update action button states based on game state."""
+        self._button_state_dirty = False
+
         # Stand/Skip button is always enabled unless completely done
         disabled = self.is_done or self.is_busted or self.is_surrendered
         stand_state = tk.DISABLED if disabled else tk.NORMAL
-        self.stand_skip_btn.config(state=stand_state)
 
         # Split button: only enabled when split is possible and not pending split dealing
         split_enabled = (self.can_split() and
                          not disabled and
-                         not getattr(self, 'pending_split', False) and
-                         getattr(self, 'play_phase', True))
+                         not self.pending_split and
+                         self.play_phase)
         split_state = tk.NORMAL if split_enabled else tk.DISABLED
-        self.split_btn.config(state=split_state)
 
         # Reset button is always enabled
         reset_state = tk.NORMAL
-        self.reset_btn.config(state=reset_state)
 
-        print(f"PLAYER: Button states - Stand/Skip: {stand_state}, Split: {split_state}, Reset: {reset_state}")
+        if self._enabled_state is False:
+            # Panel disabled by set_enabled(False): redraws must not re-enable actions
+            stand_state = split_state = reset_state = tk.DISABLED
+
+        self._set_if_changed(self.stand_skip_btn, state=stand_state)
+        self._set_if_changed(self.split_btn, state=split_state)
+        self._set_if_changed(self.reset_btn, state=reset_state)
+
+    def _set_if_changed(self, widget, **options):
+        """Configure only the ``options`` that differ from what was last set on ``widget``."""
+        cache = self._widget_cache.setdefault(widget, {})
+        changed = {key: value for key, value in options.items() if cache.get(key) != value}
+        if changed:
+            widget.config(**changed)
+            cache.update(changed)
 
     def can_split(self, hand_idx=None):
         """Check if hand can be split - LIMITED to once per hand."""
@@ -428,7 +610,7 @@ class PlayerPanel(BaseCardPanel):
 
         # Check if this hand has already been split
         if hand_idx in self.split_history:
-            print(f"PLAYER: Cannot split hand {hand_idx} - already split once")
+            logger.debug("Cannot split hand %d - already split once", hand_idx)
             return False
 
         hand = self.hands[hand_idx]
@@ -436,11 +618,7 @@ class PlayerPanel(BaseCardPanel):
             return False
 
         # Check if same value
-        rank1, rank2 = hand[0][0], hand[1][0]
-        val1 = 10 if rank1 in ['T', '10', 'J', 'Q', 'K'] else (11 if rank1 == 'A' else int(rank1))
-        val2 = 10 if rank2 in ['T', '10', 'J', 'Q', 'K'] else (11 if rank2 == 'A' else int(rank2))
-
-        return val1 == val2
+        return _SPLIT_VAL[hand[0][0]] == _SPLIT_VAL[hand[1][0]]
 
     def split_hand(self):
         """Split current hand - with split limitation tracking."""
@@ -452,7 +630,7 @@ class PlayerPanel(BaseCardPanel):
         if len(current) != 2:
             return False
 
-        print(f"PLAYER: Splitting hand {current_hand_idx} with cards {current}")
+        logger.debug("Splitting hand %d with cards %s", current_hand_idx, current)
 
         # Create second hand and prepare to deal a second card to each
         second_card = current.pop()
@@ -461,55 +639,60 @@ class PlayerPanel(BaseCardPanel):
 
         # Mark this hand as having been split (prevent future splits)
         self.split_history.add(current_hand_idx)
-        print(f"PLAYER: Added hand {current_hand_idx} to split history: {self.split_history}")
+        logger.debug("Added hand %d to split history: %s", current_hand_idx, self.split_history)
 
         # Show new hand display and flag that the next card inputs
         # should go to each hand in order.
-        self._add_hand_display()
+        self._show_hand_displays(len(self.hands))
         self.pending_split = True
         self.pending_index = 0
         self.current_hand = 0
         self.is_done = False
         self.is_busted = False
-        self.update_display()
+        self._button_state_dirty = True
+        self._schedule_update_display()
         return True
 
     def surrender(self):
         """Surrender current hand."""
         self.is_surrendered = True
         self.is_done = True
-        self.update_display()
+        self._button_state_dirty = True
+        self._schedule_update_display()
 
     def stand(self):
         """Stand current hand."""
         self.is_done = True
-        self.update_display()
+        self._button_state_dirty = True
+        self._schedule_update_display()
 
     def undo(self, hand_idx=None):
         """Undo last card and reactivate hand if needed."""
+        if hand_idx is None:
+            hand_idx = self.current_hand
         card = super().undo(hand_idx)
-        if card is not None:
-            # Re-check completion status after card removal
-            score = self.calculate_score(hand_idx if hand_idx is not None else self.current_hand)
-            if self.is_done and not self.is_surrendered and score < 21:
-                self.is_done = False
-                self.update_display()
+        if card is None:
+            return None  # Nothing removed - nothing to redraw
+
+        # Re-check completion status after card removal
+        if self.is_done and not self.is_surrendered and self.calculate_score(hand_idx) < 21:
+            self.is_done = False
+        self._button_state_dirty = True
+        self._schedule_update_display(dirty_hand=hand_idx)
         return card
 
     def set_enabled(self, enabled):
         """Enable/disable player controls."""
+        if enabled == self._enabled_state:
+            return
+        self._enabled_state = enabled
         state = tk.NORMAL if enabled else tk.DISABLED
         for btn in self.rank_btns:
             btn.config(state=state)
         self.undo_btn.config(state=state)
 
-        # Action buttons are managed by _update_action_buttons() when enabled
-        if enabled:
-            self._update_action_buttons()
-        else:
-            self.stand_skip_btn.config(state=tk.DISABLED)
-            self.split_btn.config(state=tk.DISABLED)
-            self.reset_btn.config(state=tk.DISABLED)
+        # Action buttons follow game state when enabled and are all disabled otherwise
+        self._update_action_buttons()
 
     def reset(self):
         """Reset player panel - clear split history."""
@@ -518,5 +701,6 @@ class PlayerPanel(BaseCardPanel):
         self.pending_index = 0
         # Clear split history on reset
         self.split_history.clear()
-        print("PLAYER: Cleared split history on reset")
-        self.update_display()
\ No newline at end of file
+        logger.debug("Cleared split history on reset")
+        self._button_state_dirty = True
+        self._schedule_update_display()
\ No newline at end of file
@@ -1,12 +1,20 @@
+import logging
 import tkinter as tk
-import sys
-import os
-
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from functools import partial
 
 from constants import RANKS, COLORS, normalize_rank_display
-from .suit_selection import get_suit_selection
+
+logger = logging.getLogger(__name__)
+
+# (rank, label, width) per rank button, and their shared font - built once at import
+_RANK_SPECS = tuple((r, normalize_rank_display(r), 3 if r == '10' else 2) for r in RANKS)
+_RANK_FONT = ('Segoe UI', 9)
+
+# Action button styles (STAND / SPLIT / RESET) - UPDATED: consistent width, height and font
+_ACTION_FONT = ('Segoe UI', 9, 'bold')
+_STAND_KW = dict(width=6, height=1, font=_ACTION_FONT, bg='#ff6666', fg='white')
+_SPLIT_KW = dict(width=6, height=1, font=_ACTION_FONT, bg='#66ff66', fg='black')
+_RESET_KW = dict(width=6, height=1, font=_ACTION_FONT, bg='#ffaa00', fg='white')  # Orange background for reset
 
 
 class SharedInputPanel(tk.Frame):
@@ -14,39 +22,40 @@ class SharedInputPanel(tk.Frame):
 
     def __init__(self, parent, on_card, on_undo):
         super().__init__(parent, bg=COLORS['bg_input'])
+        self._bg = COLORS['bg_input']  # panel background, looked up once
         self.on_card = on_card
         self.on_undo = on_undo
         self.on_stand = None
         self.on_split = None
         self.on_reset_active_seat = None  # NEW: Callback for reset active seat
+        self._enabled_state = None  # last set_enabled() value
         self._build_panel()
 
     def _build_panel(self):
         """Build the panel - UPDATED with repositioned action buttons."""
         # Main container for vertical centering
-        main_container = tk.Frame(self, bg=COLORS['bg_input'])
+        main_container = tk.Frame(self, bg=self._bg)
         main_container.pack(expand=True, fill='both')
 
         # Centered content frame
-        content_frame = tk.Frame(main_container, bg=COLORS['bg_input'])
+        content_frame = tk.Frame(main_container, bg=self._bg)
         content_frame.pack(expand=True, anchor='center')
 
         # First row: Rank buttons - ENLARGED
-        rank_frame = tk.Frame(content_frame, bg=COLORS['bg_input'])
+        rank_frame = tk.Frame(content_frame, bg=self._bg)
         rank_frame.pack(pady=1)
 
         self.rank_btns = []
 
         # Rank buttons - LARGER and CLOSER
-        for ri, r in enumerate(RANKS):
-            display_rank = normalize_rank_display(r)  # Show 10 instead of T
+        for ri, (r, display_rank, width) in enumerate(_RANK_SPECS):
             b = tk.Button(
                 rank_frame,
                 text=display_rank,
-                width=2 if r != '10' else 3,  # INCREASED width (was 1/2)
+                width=width,  # INCREASED width (was 1/2)
                 height=1,  # Keep small height
-                font=('Segoe UI', 9),  # LARGER font (was 8)
-                command=lambda rank=r: self.rank_clicked(rank)
+                font=_RANK_FONT,  # LARGER font (was 8)
+                command=partial(self.rank_clicked, r)
             )
             b.grid(row=0, column=ri, padx=1)
             self.rank_btns.append(b)
@@ -63,18 +72,14 @@ class SharedInputPanel(tk.Frame):
         self.undo_btn.grid(row=0, column=len(RANKS), padx=2)
 
         # NEW: Action buttons row - LEFT-ALIGNED and horizontal
-        action_frame = tk.Frame(content_frame, bg=COLORS['bg_input'])
+        action_frame = tk.Frame(content_frame, bg=self._bg)
         action_frame.pack(anchor='w', pady=(3, 1))  # LEFT-ALIGNED with anchor='w'
 
         # Stand button - REPOSITIONED and consistent styling
         self.stand_btn = tk.Button(
             action_frame,
             text='STAND',
-            width=6,  # UPDATED: Consistent width
-            height=1,  # UPDATED: Consistent height
-            font=('Segoe UI', 9, 'bold'),  # UPDATED: Consistent font
-            bg='#ff6666',
-            fg='white',
+            **_STAND_KW,
             command=self.handle_stand
         )
         self.stand_btn.pack(side=tk.LEFT, padx=2)  # LEFT-ALIGNED in row
@@ -83,11 +88,7 @@ class SharedInputPanel(tk.Frame):
         self.split_btn = tk.Button(
             action_frame,
             text='SPLIT',
-            width=6,  # UPDATED: Consistent width
-            height=1,  # UPDATED: Consistent height
-            font=('Segoe UI', 9, 'bold'),  # UPDATED: Consistent font
-            bg='#66ff66',
-            fg='black',
+            **_SPLIT_KW,
             command=self.handle_split
         )
         self.split_btn.pack(side=tk.LEFT, padx=2)  # NEXT to Stand button
@@ -96,11 +97,7 @@ class SharedInputPanel(tk.Frame):
         self.reset_btn = tk.Button(
             action_frame,
             text='RESET',
-            width=6,  # Consistent width
-            height=1,  # Consistent height
-            font=('Segoe UI', 9, 'bold'),  # Consistent font
-            bg='#ffaa00',  # Orange background for reset
-            fg='white',
+            **_RESET_KW,
             command=self.handle_reset
         )
         self.reset_btn.pack(side=tk.LEFT, padx=2)  # NEXT to Split button
@@ -110,42 +107,50 @@ class SharedInputPanel(tk.Frame):
             action_frame,
             text="(For other players)",
             font=('Segoe UI', 7),
-            bg=COLORS['bg_input'],
+            bg=self._bg,
             fg='#cccccc'
         )
         info_label.pack(side=tk.LEFT, padx=5)
 
+        # One Tcl script per state that reconfigures every button at once
+        buttons = [*self.rank_btns, self.undo_btn, self.stand_btn, self.split_btn, self.reset_btn]
+        self._state_scripts = {
+            state: "\n".join(f"{btn._w} configure -state {state}" for btn in buttons)
+            for state in (tk.NORMAL, tk.DISABLED)
+        }
+
     def rank_clicked(self, rank):
         """SIMPLE: Handle rank button click."""
-        print(f"SHARED_INPUT: Rank {rank} clicked")
+        logger.debug("Rank %s clicked", rank)
 
         def on_suit_selected(suit):
-            print(f"SHARED_INPUT: Selected {rank}{suit}")
+            logger.debug("Selected %s%s", rank, suit)
             self.on_card(rank, suit)
 
-        # Use the SIMPLE suit selection
+        # Use the SIMPLE suit selection (imported on the first click)
+        from .suit_selection import get_suit_selection
         get_suit_selection(self, on_suit_selected)
 
     def undo(self):
         """Handle undo button click."""
-        print("SHARED_INPUT: Undo clicked")
+        logger.debug("Undo clicked")
         self.on_undo()
 
     def handle_stand(self):
         """Handle stand/skip button."""
-        print("SHARED_INPUT: Stand/Skip clicked")
+        logger.debug("Stand/Skip clicked")
         if self.on_stand:
             self.on_stand()
 
     def handle_split(self):
         """Handle split button."""
-        print("SHARED_INPUT: Split clicked")
+        logger.debug("Split clicked")
         if self.on_split:
             self.on_split()
 
     def handle_reset(self):
         """NEW: Handle reset button - resets only the active seat."""
-        print("SHARED_INPUT: Reset active seat clicked")
+        logger.debug("Reset active seat clicked")
         if self.on_reset_active_seat:
             self.on_reset_active_seat()
 
@@ -157,12 +162,10 @@ class SharedInputPanel(tk.Frame):
 
     def set_enabled(self, enabled):
         """Enable or disable all buttons."""
+        if enabled == self._enabled_state:
+            return
+        self._enabled_state = enabled
         state = tk.NORMAL if enabled else tk.DISABLED
 
-        for btn in self.rank_btns:
-            btn.config(state=state)
-
-        self.undo_btn.config(state=state)
-        self.stand_btn.config(state=state)
-        self.split_btn.config(state=state)
-        self.reset_btn.config(state=state)  # NEW: Enable/disable reset button
\ No newline at end of file
+        # Rank, undo, stand, split and reset buttons in a single Tcl round trip
+        self.tk.eval(self._state_scripts[state])
\ No newline at end of file
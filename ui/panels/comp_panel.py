@@ -4,8 +4,24 @@ Made bigger and more readable with larger fonts and better spacing.
 """
 
 import tkinter as tk
+from contextlib import contextmanager
 from constants import RANKS, COLORS, normalize_rank_display, normalize_rank_internal
 
+# Ranks as tracked in CompPanel.comp (10 is stored as T)
+INTERNAL_RANKS = ('A', '2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K')
+
+# Rank conversions resolved once at import: T shows as 10, 10 is tracked as T
+_DISPLAY = {r: normalize_rank_display(r) for r in (*RANKS, 'T')}
+_INTERNAL = {r: normalize_rank_internal(r) for r in (*RANKS, 'T', '?')}
+
+# Count strings built once: per-rank counts and cards left for up to 8 decks
+_NUM_STR = tuple(str(i) for i in range(8 * 52 + 1))
+
+
+def _num_str(n):
+    """str(n), taken from _NUM_STR when in range (over-logged ranks go negative)."""
+    return _NUM_STR[n] if 0 <= n < len(_NUM_STR) else str(n)
+
 
 class CompPanel(tk.Frame):
     """ENLARGED Panel showing card composition and deck penetration."""
@@ -17,9 +33,26 @@ class CompPanel(tk.Frame):
         self.decks = initial_decks
         self.on_decks_change = on_decks_change
         # Use internal T for tracking, but display as 10
-        self.comp = {r: 0 for r in ['A', '2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K']}
+        self._full_per_rank = initial_decks * 4  # Cards of each rank in a full shoe
+        self.comp = dict.fromkeys(INTERNAL_RANKS, 0)
+        self._seen = 0  # Running sum(self.comp.values())
+
+        # Redraw coalescing: card events only mark the display dirty and one
+        # idle-time (or end-of-batch) update_display() catches up
+        self._batch_depth = 0
+        self._dirty = False
+        self._dirty_ranks = set()  # Ranks to repaint on flush; None means all of them
+        self._flush_scheduled = False
+
+        # Last text written per label key and last pen bar width, so
+        # update_display() only touches what changed
+        self._last_text = {}
+        self._last_pen_width = None
+
         self._build_panel()
         self.update_display()
+        # Redraws are skipped while the panel is not on screen; catch up when it is
+        self.bind('<Map>', self._on_map, add='+')
 
     def _build_panel(self):
         """Build the COMPACT composition panel UI."""
@@ -47,8 +80,9 @@ class CompPanel(tk.Frame):
         cards_frame.pack(pady=1)
         tk.Label(cards_frame, text='Left:', font=('Segoe UI', 9, 'bold'),  # Smaller font
                  bg=COLORS['bg_white']).pack(side=tk.LEFT)
+        self._cards_left_var = tk.StringVar(self, value="416")
         self.cards_left_label = tk.Label(
-            cards_frame, text="416",
+            cards_frame, textvariable=self._cards_left_var,
             font=('Segoe UI', 12, 'bold'),  # Smaller font
             fg=COLORS['fg_blue'],
             bg=COLORS['bg_white']
@@ -66,7 +100,10 @@ class CompPanel(tk.Frame):
             highlightthickness=0
         )
         self.pen_bar.pack(side=tk.LEFT, padx=2)
-        self.pen_label = tk.Label(pen_frame, text="0.0%", font=('Segoe UI', 9, 'bold'),  # Smaller font
+        # Fill rectangle drawn once; update_display() only resizes it
+        self._pen_rect = self.pen_bar.create_rectangle(0, 0, 0, 12, fill=COLORS['fg_dealer'], outline="")
+        self._pen_var = tk.StringVar(self, value="0.0%")
+        self.pen_label = tk.Label(pen_frame, textvariable=self._pen_var, font=('Segoe UI', 9, 'bold'),  # Smaller font
                                   bg=COLORS['bg_white'])
         self.pen_label.pack(side=tk.LEFT, padx=2)
 
@@ -74,111 +111,224 @@ class CompPanel(tk.Frame):
         self._build_composition_grid()
 
     def _build_composition_grid(self):
-        """Build the COMPACT card composition display grid."""
-        # COMPACT: Rank headers
-        display_ranks = [normalize_rank_display(r) for r in
-                         ['A', '2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K']]
-        for ci, r in enumerate(display_ranks):
-            tk.Label(
-                self, text=r,
-                font=('Segoe UI', 9, 'bold'),  # Smaller font
-                bg=COLORS['bg_white'],
-                width=2,  # Narrower cells
-                height=1  # Shorter cells
-            ).grid(row=0, column=ci + 1, padx=1, pady=1)  # Less padding
-
-        # COMPACT: Combined composition/remaining row
-        internal_ranks = ['A', '2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K']
-
-        self.comp_labels = {}
-        self.rem_labels = {}
-
-        for ci, r in enumerate(internal_ranks):
-            # COMPACT: Create smaller frame for both dealt and remaining
-            cell_frame = tk.Frame(self, bg=COLORS['bg_white'])
-            cell_frame.grid(row=1, column=ci + 1, padx=1, pady=1)  # Less padding
+        """Build the COMPACT card composition display grid.
+
+        Headers and the dealt/remaining cells are items on one Canvas rather
+        than 39 Label widgets, so updates are itemconfigure() calls with no
+        geometry management.
+        """
+        cell_w, cell_h, pad = 22, 18, 2  # COMPACT: roughly a width=2 Label in 9pt bold
+        font = ('Segoe UI', 9, 'bold')
+
+        self.grid_canvas = tk.Canvas(
+            self, bg=COLORS['bg_white'], highlightthickness=0,
+            width=pad + len(INTERNAL_RANKS) * (cell_w + pad),
+            height=pad + 3 * (cell_h + pad)
+        )
+        self.grid_canvas.grid(row=0, column=1, rowspan=2, sticky='nw', padx=1, pady=1)
+
+        self._dealt_item = {}
+        self._rem_item = {}
+
+        for ci, r in enumerate(INTERNAL_RANKS):
+            x0 = pad + ci * (cell_w + pad)
+            cx = x0 + cell_w // 2
+
+            # COMPACT: Rank header
+            self.grid_canvas.create_text(cx, pad + cell_h // 2, text=_DISPLAY[r], font=font)
 
             # COMPACT: Dealt count (top)
-            dealt_lbl = tk.Label(
-                cell_frame, text='0',
-                font=('Segoe UI', 9, 'bold'),  # Smaller font
-                width=2, height=1,  # Smaller cells
-                fg=COLORS['fg_comp_cell'],
-                bg=COLORS['bg_comp_cell'],
-                bd=1, relief=tk.SUNKEN  # Thinner border
-            )
-            dealt_lbl.pack(pady=0)
-            self.comp_labels[r] = dealt_lbl
+            y0 = pad + (cell_h + pad)
+            self._draw_cell(x0, y0, cell_w, cell_h, COLORS['bg_comp_cell'])
+            self._dealt_item[r] = self.grid_canvas.create_text(
+                cx, y0 + cell_h // 2, text='0', font=font, fill=COLORS['fg_comp_cell'])
 
             # COMPACT: Remaining count (bottom)
-            remain_lbl = tk.Label(
-                cell_frame, text='32',
-                font=('Segoe UI', 9, 'bold'),  # Smaller font
-                width=2, height=1,  # Smaller cells
-                fg=COLORS['fg_white'],
-                bg=COLORS['bg_rem_cell'],
-                bd=1, relief=tk.SUNKEN  # Thinner border
-            )
-            remain_lbl.pack(pady=0)
-            self.rem_labels[r] = remain_lbl
-
-    def update_display(self):
-        """Update all display elements."""
-        d = self.decks
-        internal_ranks = ['A', '2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K']
+            y0 += cell_h + pad
+            self._draw_cell(x0, y0, cell_w, cell_h, COLORS['bg_rem_cell'])
+            self._rem_item[r] = self.grid_canvas.create_text(
+                cx, y0 + cell_h // 2, text='32', font=font, fill=COLORS['fg_white'])
+
+    def _draw_cell(self, x0, y0, cell_w, cell_h, bg):
+        """Draw a cell background with a SUNKEN-style shadow on its top/left edge."""
+        self.grid_canvas.create_rectangle(x0, y0, x0 + cell_w, y0 + cell_h, fill='#808080', outline='')
+        self.grid_canvas.create_rectangle(x0 + 1, y0 + 1, x0 + cell_w, y0 + cell_h, fill=bg, outline='')
+
+    @contextmanager
+    def batch_updates(self):
+        """Defer redraws until the outermost batch exits, then redraw once."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush()
+
+    def _mark_dirty(self, *ranks):
+        """Note that self.comp changed and queue one idle-time redraw.
+
+        ``ranks`` limits the repaint to those ranks' cells (plus the totals);
+        with no ranks every cell is repainted.
+        """
+        if not ranks:
+            self._dirty_ranks = None
+        elif self._dirty_ranks is not None:
+            self._dirty_ranks.update(ranks)
+        self._dirty = True
+        if not self._batch_depth and not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush)
+
+    def _flush(self):
+        """Redraw if anything changed since the last update_display().
+
+        While the panel is unmapped the change stays pending for _on_map().
+        """
+        self._flush_scheduled = False
+        if not self._dirty or self._batch_depth or not self.winfo_ismapped():
+            return
+        if self._dirty_ranks is None:
+            self.update_display()
+            return
+
+        # Only the ranks touched since the last redraw
+        ranks, self._dirty_ranks = self._dirty_ranks, set()
+        self._dirty = False
+        for r in ranks:
+            self._refresh_rank(r)
+        self._refresh_totals()
+
+    def _on_map(self, event):
+        """Apply changes made while the panel was hidden."""
+        self._flush()
+
+    def update_display(self, force=False):
+        """Update all display elements.
+
+        Tk lays the changes out on its next idle pass; ``force`` runs that
+        pass now for callers that measure the panel right afterwards.
+        """
+        self._dirty = False
+        self._dirty_ranks = set()
 
         # Update composition and remaining counts
-        for r in internal_ranks:
-            dealt = self.comp[r]
-            remain = d * 4 - dealt
-            self.comp_labels[r].config(text=str(dealt))
-            self.rem_labels[r].config(text=str(remain))
+        for r in INTERNAL_RANKS:
+            self._refresh_rank(r)
+        self._refresh_totals()
+        if force:
+            self.update_idletasks()
+
+    def _refresh_rank(self, r):
+        """Update one rank's dealt and remaining cells."""
+        dealt = self.comp[r]
+        self._set_item(self._dealt_item[r], ('dealt', r), _num_str(dealt))
+        self._set_item(self._rem_item[r], ('rem', r), _num_str(self._full_per_rank - dealt))
 
+    def _refresh_totals(self):
+        """Update the cards-left count and the penetration bar and label."""
         # Update cards remaining
         cards_rem = self.cards_left()
-        self.cards_left_label.config(text=str(cards_rem))
+        self._set(self._cards_left_var, 'left', _num_str(cards_rem))
 
-        # Update COMPACT penetration bar
+        # Update COMPACT penetration bar (only when its pixel width changes)
         pct, seen, total = self.penetration()
-        self.pen_bar.delete("all")
-        if total > 0:
-            width = int((pct / 100) * 50)  # Adjusted for smaller bar
-            self.pen_bar.create_rectangle(0, 0, width, 12, fill=COLORS['fg_dealer'], outline="")
-        self.pen_label.config(text=f"{pct:.1f}%")
+        width = int((pct / 100) * 50) if total > 0 else 0  # Adjusted for smaller bar
+        if width != self._last_pen_width:
+            self._last_pen_width = width
+            self.pen_bar.coords(self._pen_rect, 0, 0, width, 12)
+        self._set(self._pen_var, 'pen', f"{pct:.1f}%")
+
+    def _set(self, var, key, text):
+        """Set a label's text variable only if it differs from what was last written."""
+        if self._last_text.get(key) == text:
+            return
+        self._last_text[key] = text
+        var.set(text)
+
+    def _set_item(self, item, key, text):
+        """Same as _set() for a text item on the composition grid canvas."""
+        if self._last_text.get(key) == text:
+            return
+        self._last_text[key] = text
+        self.grid_canvas.itemconfigure(item, text=text)
 
     def set_decks(self):
         """Handle deck count change."""
         self.decks = self.deck_var.get()
+        self._full_per_rank = self.decks * 4
         self.reset()
         self.on_decks_change()
 
     def reset(self):
         """Reset all composition counts."""
-        self.comp = {r: 0 for r in ['A', '2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K']}
-        self.update_display()
+        self.comp = dict.fromkeys(INTERNAL_RANKS, 0)
+        self._seen = 0
+        self._mark_dirty()
+
+    def restore(self, comp):
+        """Replace all composition counts at once (e.g. from a saved state).
+
+        10 and T both count as T; mystery cards ('?') and unknown ranks are
+        skipped, as in log_card().
+        """
+        self.comp = dict.fromkeys(INTERNAL_RANKS, 0)
+        for rank, count in comp.items():
+            internal_rank = _INTERNAL.get(rank)
+            if internal_rank in self.comp:  # '?' maps to itself, not a tracked rank
+                self.comp[internal_rank] += count
+        self._seen = sum(self.comp.values())
+        self._mark_dirty()
 
     def log_card(self, rank):
         """Log a dealt card - convert 10 to T internally."""
-        internal_rank = normalize_rank_internal(rank)
-        if internal_rank != "?":  # Don't log mystery cards
-            self.comp[internal_rank] += 1
-            self.update_display()
+        changed = self._log(rank)
+        if changed:
+            self._mark_dirty(changed)
+
+    def log_cards(self, ranks):
+        """Log several dealt cards with a single redraw."""
+        changed = {self._log(rank) for rank in ranks} - {None}
+        if changed:
+            self._mark_dirty(*changed)
 
     def undo_card(self, rank):
         """Undo a dealt card - convert 10 to T internally."""
-        internal_rank = normalize_rank_internal(rank)
-        if internal_rank != "?" and self.comp[internal_rank] > 0:
-            self.comp[internal_rank] -= 1
-            self.update_display()
+        changed = self._unlog(rank)
+        if changed:
+            self._mark_dirty(changed)
+
+    def undo_cards(self, ranks):
+        """Undo several dealt cards with a single redraw."""
+        changed = {self._unlog(rank) for rank in ranks} - {None}
+        if changed:
+            self._mark_dirty(*changed)
+
+    def _log(self, rank):
+        """Count one dealt card; returns the internal rank changed, or None."""
+        internal_rank = _INTERNAL.get(rank, rank)
+        if internal_rank == "?":  # Don't log mystery cards
+            return None
+        self.comp[internal_rank] += 1
+        self._seen += 1
+        return internal_rank
+
+    def _unlog(self, rank):
+        """Remove one dealt card; returns the internal rank changed, or None."""
+        internal_rank = _INTERNAL.get(rank, rank)
+        if internal_rank == "?" or self.comp[internal_rank] <= 0:
+            return None
+        self.comp[internal_rank] -= 1
+        self._seen -= 1
+        return internal_rank
 
     def cards_left(self):
         """Calculate cards remaining in shoe."""
-        return sum(
-            self.decks * 4 - self.comp[r] for r in ['A', '2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K'])
+        return self.decks * 52 - self._seen
 
     def penetration(self):
         """Calculate penetration percentage."""
-        seen = sum(self.comp.values())
+        seen = self._seen
         total = self.decks * 52
         pct = (seen / total) * 100 if total > 0 else 0
         return pct, seen, total
\ No newline at end of file
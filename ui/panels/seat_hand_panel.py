@@ -3,8 +3,15 @@ IMPROVED seat panel with stacked card display.
 UPDATED with split limitation logic and stacked card rendering.
 """
 
+import itertools
+import logging
 import tkinter as tk
-from constants import RANKS, COLORS, normalize_rank_display, normalize_rank_internal
+from constants import RANKS, COLORS, RANK_VALUES, hand_total, normalize_rank_display, normalize_rank_internal
+
+logger = logging.getLogger(__name__)
+
+# Unique per-card canvas tags, so one move/itemconfigure addresses a whole card
+_card_tags = itertools.count()
 
 
 class SeatHandPanel(tk.Frame):
@@ -33,6 +40,13 @@ class SeatHandPanel(tk.Frame):
         # Track which hands have been split to limit splitting to once per hand
         self.split_history = set()
 
+        # Set while an idle-time redraw is queued (see _schedule_update)
+        self._update_pending = False
+        # _state_key() of what is currently drawn; equal keys skip the redraw
+        self._last_state_key = None
+        # True while split-hand labels may still be drawn on the first display
+        self._split_drawn = False
+
         self.pack_propagate(False)
         self._build_panel()
 
@@ -40,11 +54,11 @@ class SeatHandPanel(tk.Frame):
         """Build the improved seat display with stacked card layout."""
         # Seat label with background color coding
         seat_color = self._get_background_color()
-        seat_frame = tk.Frame(self, bg=seat_color, height=20)
+        self._seat_frame = seat_frame = tk.Frame(self, bg=seat_color, height=20)
         seat_frame.pack(fill='x')
         seat_frame.pack_propagate(False)
 
-        seat_label = tk.Label(
+        self._seat_label = seat_label = tk.Label(
             seat_frame, text=self.seat,
             font=('Segoe UI', 10, 'bold'),
             bg=seat_color,
@@ -77,7 +91,12 @@ class SeatHandPanel(tk.Frame):
         self.display_frame.pack_propagate(False)
 
         self.displays = []
+        # Per hand display: cards shown on its canvas, and hidden spares that
+        # update_display() reuses before building new ones
         self.card_widgets = []
+        self._card_pools = []
+        # Per hand display: its split indicator text item, built on first use
+        self._hand_labels = []
         self._add_hand_display()
 
         # Only skip button for other seats
@@ -112,9 +131,16 @@ class SeatHandPanel(tk.Frame):
         hand_canvas.pack(fill='both', expand=True, pady=1)
         self.displays.append(hand_canvas)
         self.card_widgets.append([])
+        self._card_pools.append([])
+        self._hand_labels.append(None)
 
     def create_stacked_seat_card_widget(self, rank, suit, canvas, x_offset):
-        """UPDATED: Create a stacked card widget optimized for compact seat display."""
+        """UPDATED: Draw a stacked card optimized for compact seat display.
+
+        The card is a rectangle and two text items on the hand's canvas, all
+        sharing one per-card tag. Returns a dict with the item ids and that tag
+        so the card can later be reconfigured by _configure_seat_card().
+        """
         # COMPACT dimensions for seat panels
         card_width = 20
         card_height = 28
@@ -128,29 +154,35 @@ class SeatHandPanel(tk.Frame):
         # Display rank (show 10 instead of T)
         display_rank = normalize_rank_display(rank)
 
-        # Create card frame - COMPACT for seats
-        card_frame = tk.Frame(canvas, bg='white', bd=1, relief=tk.RAISED,
-                              width=card_width, height=card_height)
-        card_frame.pack_propagate(False)
-
-        # UPDATED: Position using canvas for stacking
+        # UPDATED: Position on the canvas for stacking
         y_position = 5  # Fixed vertical position
-        canvas.create_window(x_offset, y_position, window=card_frame, anchor='nw')
+        tag = f"card{next(_card_tags)}"
+        tags = ('card', tag)
 
-        # Update canvas scroll region
-        canvas.configure(scrollregion=canvas.bbox("all"))
+        # Card face - COMPACT for seats
+        canvas.create_rectangle(x_offset, y_position, x_offset + card_width, y_position + card_height,
+                                fill='white', outline='#808080', tags=tags)
 
         # Card rank (center) - COMPACT font
-        rank_label = tk.Label(card_frame, text=display_rank, font=('Arial', 5, 'bold'),
-                              fg=card_color, bg='white')
-        rank_label.pack(expand=True)
+        rank_item = canvas.create_text(x_offset + card_width // 2, y_position + 10, text=display_rank,
+                                       font=('Arial', 5, 'bold'), fill=card_color, tags=tags)
 
         # Card suit (bottom) - COMPACT font
-        suit_label = tk.Label(card_frame, text=suit, font=('Arial', 6, 'bold'),
-                              fg=card_color, bg='white')
-        suit_label.pack()
-
-        return card_frame
+        suit_item = canvas.create_text(x_offset + card_width // 2, y_position + 21, text=suit,
+                                       font=('Arial', 6, 'bold'), fill=card_color, tags=tags)
+
+        return {'tag': tag, 'rank': rank_item, 'suit': suit_item, 'face': (rank, suit), 'x': x_offset}
+
+    def _configure_seat_card(self, canvas, card, rank, suit, x_offset):
+        """Point an existing seat card at (rank, suit) and move it to x_offset."""
+        if card['face'] != (rank, suit):
+            card_color = '#ff4444' if suit in ['♥', '♦'] else 'black'
+            canvas.itemconfigure(card['rank'], text=normalize_rank_display(rank), fill=card_color)
+            canvas.itemconfigure(card['suit'], text=suit, fill=card_color)
+            card['face'] = (rank, suit)
+        if card['x'] != x_offset:
+            canvas.move(card['tag'], x_offset - card['x'], 0)
+            card['x'] = x_offset
 
     def _action(self, action):
         """Handle action button clicks."""
@@ -168,7 +200,7 @@ class SeatHandPanel(tk.Frame):
 
         # Check if this hand has already been split
         if hand_idx in self.split_history:
-            print(f"SEAT {self.seat}: Cannot split hand {hand_idx} - already split once")
+            logger.debug("%s cannot split hand %s - already split once", self.seat, hand_idx)
             return False
 
         hand = self.hands[hand_idx]
@@ -176,25 +208,22 @@ class SeatHandPanel(tk.Frame):
             return False
 
         # Check if both cards have same value
-        rank1, rank2 = hand[0][0], hand[1][0]
-        val1 = 10 if rank1 in ['T', '10', 'J', 'Q', 'K'] else (11 if rank1 == 'A' else int(rank1))
-        val2 = 10 if rank2 in ['T', '10', 'J', 'Q', 'K'] else (11 if rank2 == 'A' else int(rank2))
-
-        return val1 == val2
+        val1 = RANK_VALUES.get(hand[0][0])
+        return val1 is not None and val1 == RANK_VALUES.get(hand[1][0])
 
     def split_hand(self):
         """Split the current hand into two hands - with split limitation tracking."""
         if not self.can_split():
-            print(f"SPLIT: Cannot split {self.seat} - conditions not met")
+            logger.debug("Cannot split %s - conditions not met", self.seat)
             return False
 
         current_hand_idx = self.current_hand
         current = self.hands[current_hand_idx]
         if len(current) != 2:
-            print(f"SPLIT: Cannot split {self.seat} - need exactly 2 cards")
+            logger.debug("Cannot split %s - need exactly 2 cards", self.seat)
             return False
 
-        print(f"SPLIT: Splitting {self.seat} hand {current_hand_idx} with {current}")
+        logger.debug("Splitting %s hand %s with %s", self.seat, current_hand_idx, current)
 
         # Create second hand with second card
         second_card = current.pop()
@@ -203,9 +232,9 @@ class SeatHandPanel(tk.Frame):
 
         # Mark this hand as having been split (prevent future splits)
         self.split_history.add(current_hand_idx)
-        print(f"SPLIT: Added hand {current_hand_idx} to {self.seat} split history: {self.split_history}")
+        logger.debug("Added hand %s to %s split history: %s", current_hand_idx, self.seat, self.split_history)
 
-        print(f"SPLIT: {self.seat} now has hands: {self.hands}")
+        logger.debug("%s now has hands: %s", self.seat, self.hands)
 
         # Reset to first hand and clear done status
         self.current_hand = 0
@@ -217,9 +246,9 @@ class SeatHandPanel(tk.Frame):
 
         # Add new display for second hand
         self._add_hand_display()
-        self.update_display()
+        self._schedule_update()
 
-        print(f"SPLIT: {self.seat} split complete, current_hand={self.current_hand}")
+        logger.debug("%s split complete, current_hand=%s", self.seat, self.current_hand)
         return True
 
     def add_card(self, rank, suit, hand_idx=None):
@@ -230,10 +259,10 @@ class SeatHandPanel(tk.Frame):
             hand_idx = self.current_hand
 
         if hand_idx >= len(self.hands):
-            print(f"ERROR: Trying to add card to hand {hand_idx}, but only have {len(self.hands)} hands")
+            logger.warning("Trying to add card to hand %s, but only have %s hands", hand_idx, len(self.hands))
             return
 
-        print(f"ADD_CARD: Adding {rank}{suit} to {self.seat} hand {hand_idx + 1}")
+        logger.debug("Adding %s%s to %s hand %s", rank, suit, self.seat, hand_idx + 1)
         self.hands[hand_idx].append((rank, suit))
 
         # During the split dealing phase just move to the next hand until
@@ -252,11 +281,11 @@ class SeatHandPanel(tk.Frame):
             # Check for bust on the specific hand
             score = self.calculate_score(hand_idx)
             if score > 21:
-                print(f"ADD_CARD: Hand {hand_idx + 1} busted with {score}")
+                logger.debug("Hand %s busted with %s", hand_idx + 1, score)
                 if hand_idx == self.current_hand:
                     self.is_busted = True
 
-        self.update_display()
+        self._schedule_update()
 
     def is_current_hand_done(self):
         """Check if the current hand is done."""
@@ -275,11 +304,11 @@ class SeatHandPanel(tk.Frame):
             self.current_hand += 1
             self.is_done = False
             self.is_busted = False
-            self.update_display()
+            self._schedule_update()
             return True  # another split hand remains
         else:
             self.is_done = True
-            self.update_display()
+            self._schedule_update()
             return False  # all hands finished
 
     def should_advance_focus(self):
@@ -305,25 +334,25 @@ class SeatHandPanel(tk.Frame):
 
     def stand(self):
         """Mark current hand as done and handle split progression."""
-        print(f"STAND: {self.seat} standing hand {self.current_hand + 1}")
+        logger.debug("%s standing hand %s", self.seat, self.current_hand + 1)
 
         if len(self.hands) > 1:  # Split hands exist
             if self.current_hand < len(self.hands) - 1:
                 # More split hands to play, advance to next
                 self.current_hand += 1
-                print(f"STAND: {self.seat} advanced to hand {self.current_hand + 1}")
-                self.update_display()
+                logger.debug("%s advanced to hand %s", self.seat, self.current_hand + 1)
+                self._schedule_update()
                 return False  # Still have hands to play
             else:
                 # All split hands completed
                 self.is_done = True
-                print(f"STAND: {self.seat} all hands completed")
-                self.update_display()
+                logger.debug("%s all hands completed", self.seat)
+                self._schedule_update()
                 return True  # Completely done
         else:
             # Single hand, just stand
             self.is_done = True
-            self.update_display()
+            self._schedule_update()
             return True  # Completely done
 
     def calculate_score(self, hand_idx=None):
@@ -334,30 +363,7 @@ class SeatHandPanel(tk.Frame):
         if hand_idx >= len(self.hands):
             return 0
 
-        hand = self.hands[hand_idx]
-        if not hand:
-            return 0
-
-        total = 0
-        aces = 0
-
-        for rank, suit in hand:
-            if rank in ['J', 'Q', 'K']:
-                total += 10
-            elif rank in ['T', '10']:
-                total += 10
-            elif rank == 'A':
-                aces += 1
-                total += 11
-            else:
-                total += int(rank)
-
-        # Adjust for aces
-        while total > 21 and aces > 0:
-            total -= 10
-            aces -= 1
-
-        return total
+        return hand_total(self.hands[hand_idx])[0]
 
     def get_score_display(self, hand_idx=None):
         """Get formatted score display text."""
@@ -380,21 +386,58 @@ class SeatHandPanel(tk.Frame):
         else:
             return str(score)
 
-    def update_display(self):
-        """UPDATED: Update the display with stacked cards and scores."""
-        # Clear all existing card widgets
-        for hand_widgets in self.card_widgets:
-            for widget in hand_widgets:
-                try:
-                    widget.destroy()
-                except:
-                    pass
-
-        # Reset card widgets tracking
-        self.card_widgets = []
+    def _state_key(self):
+        """Everything update_display() draws from, as a comparable value.
 
-        # Stacking parameters for compact seat display
-        stack_offset = 12  # Compact offset for seat cards
+        The first element covers the cards and hand labels; the rest are the
+        flags that only feed the score and status labels.
+        """
+        return ((tuple(map(tuple, self.hands)), self.current_hand, frozenset(self.split_history)),
+                self.is_busted, self.is_surrendered, self.is_done)
+
+    def _schedule_update(self):
+        """Queue one idle-time redraw for a burst of state changes."""
+        if not self._update_pending:
+            self._update_pending = True
+            self.after_idle(self._do_update)
+
+    def _do_update(self):
+        """Run the redraw queued by _schedule_update()."""
+        if self._update_pending:
+            self.update_display()
+
+    def update_display(self, force=False):
+        """UPDATED: Update the display with stacked cards and scores.
+
+        Card widgets are reused: existing ones are reconfigured in place,
+        surplus ones are hidden in the display's pool, and new widgets are
+        only built when the pool is empty. Tk lays the changes out on its
+        next idle pass; ``force`` runs that pass now.
+        """
+        self._update_pending = False  # a direct call covers any queued redraw
+
+        state_key = self._state_key()
+        last_key = self._last_state_key
+        if state_key == last_key:
+            # Nothing shown by this panel changed since the last redraw
+            if force:
+                self.update_idletasks()
+            return
+        self._last_state_key = state_key
+
+        if last_key is not None and state_key[0] == last_key[0]:
+            # Only flags changed (stand, surrender): the cards stay as drawn
+            self._refresh_state_only()
+            if force:
+                self.update_idletasks()
+            return
+
+        if len(self.hands) == 1 and not self._split_drawn and self.displays:
+            # Common case: one hand and no split labels to clear
+            self._update_single_hand()
+            if force:
+                self.update_idletasks()
+            return
 
         # Update each hand display
         for i, hand in enumerate(self.hands):
@@ -402,32 +445,30 @@ class SeatHandPanel(tk.Frame):
                 self._add_hand_display()
 
             canvas = self.displays[i]
-            self.card_widgets.append([])
-
-            # Clear the canvas
-            canvas.delete("all")
+            label = self._hand_labels[i]
 
-            # Add hand indicator for splits
+            # Hand indicator for splits: one text item per display, reconfigured
             if len(self.hands) > 1:
                 # Show split limitation status
                 split_status = " (No Resplit)" if i in self.split_history else ""
                 hand_text = f"H{i + 1}" + (" ←" if i == self.current_hand else "") + split_status
-
-                # Create compact hand label on canvas
-                canvas.create_text(2, 2, text=hand_text,
-                                   font=('Segoe UI', 5, 'bold'),
-                                   fill='#ffff00' if i == self.current_hand else '#888888',
-                                   anchor='nw')
+                fill = '#ffff00' if i == self.current_hand else '#888888'
+
+                if label is None:
+                    # Create compact hand label on canvas
+                    self._hand_labels[i] = canvas.create_text(
+                        2, 2, text=hand_text, font=('Segoe UI', 5, 'bold'),
+                        fill=fill, anchor='nw', tags="hand_label")
+                    canvas.tag_lower("hand_label")  # Cards overlap it, as before
+                else:
+                    canvas.itemconfigure(label, text=hand_text, fill=fill, state='normal')
+            elif label is not None:
+                canvas.itemconfigure(label, state='hidden')
 
             # Position cards with stacking
-            current_x = 5
+            current_x = self._place_hand_cards(i, hand)
             y_offset = 15 if len(self.hands) > 1 else 5  # Lower position for split hands with labels
 
-            for card_idx, (rank, suit) in enumerate(hand):
-                card_widget = self.create_stacked_seat_card_widget(rank, suit, canvas, current_x)
-                self.card_widgets[i].append(card_widget)
-                current_x += stack_offset
-
             # Update canvas dimensions for compact display
             total_width = current_x + 20 if hand else 60
             canvas_height = 35 + y_offset
@@ -435,31 +476,79 @@ class SeatHandPanel(tk.Frame):
             canvas.configure(width=min(total_width, 85))  # Keep within seat panel width
             canvas.configure(height=canvas_height)
 
-        # Update score display (show current hand score)
-        if len(self.hands) > 1:
-            # For splits, show current hand score with indicator
-            current_score = self.get_score_display(self.current_hand)
-            self.score_label.config(text=f"H{self.current_hand + 1}: {current_score}")
-        else:
-            # Single hand, show normal score
-            score_text = self.get_score_display()
-            self.score_label.config(text=score_text)
+        # Displays past the last hand (e.g. a split undone by restoring hands)
+        # park their cards and hide their indicator
+        for i in range(len(self.hands), len(self.displays)):
+            self._place_hand_cards(i, ())
+            if self._hand_labels[i] is not None:
+                self.displays[i].itemconfigure(self._hand_labels[i], state='hidden')
+
+        self._split_drawn = len(self.hands) > 1
+
+        self._refresh_state_only()
+
+        if force:
+            self.update_idletasks()
+
+    def _update_single_hand(self):
+        """update_display() for an unsplit hand: no hand labels to redraw."""
+        hand = self.hands[0]
+        current_x = self._place_hand_cards(0, hand)
+        self.displays[0].configure(width=min(current_x + 20 if hand else 60, 85), height=40)
+        self._refresh_state_only()
+
+    def _refresh_state_only(self):
+        """Update the score and status labels; the cards are left as drawn."""
+        split = len(self.hands) > 1
+
+        # Update score display (for splits, the current hand with an indicator)
+        score_text = self.get_score_display(self.current_hand)
+        if split:
+            score_text = f"H{self.current_hand + 1}: {score_text}"
+        self.score_label.config(text=score_text)
 
         # Update status
         if self.is_surrendered:
-            self.status_label.config(text="SUR")
+            status = "SUR"
         elif self.is_busted:
-            self.status_label.config(text="BUST")
+            status = "BUST"
         elif self.is_done:
-            if len(self.hands) > 1:
-                self.status_label.config(text="DONE")
-            else:
-                self.status_label.config(text="STAND")
+            status = "DONE" if split else "STAND"
         else:
-            if len(self.hands) > 1:
-                self.status_label.config(text=f"HAND {self.current_hand + 1}")
+            status = f"HAND {self.current_hand + 1}" if split else ""
+        self.status_label.config(text=status)
+
+    def _place_hand_cards(self, i, hand):
+        """Lay out hand ``i``'s cards on its canvas, reusing pooled card items.
+
+        Returns the x position just past the last card.
+        """
+        canvas = self.displays[i]
+        shown = self.card_widgets[i]
+        pool = self._card_pools[i]
+
+        stack_offset = 12  # Compact offset for seat cards
+        current_x = 5
+        for card_idx, (rank, suit) in enumerate(hand):
+            if card_idx < len(shown):
+                self._configure_seat_card(canvas, shown[card_idx], rank, suit, current_x)
+            elif pool:
+                card = pool.pop()
+                self._configure_seat_card(canvas, card, rank, suit, current_x)
+                canvas.itemconfigure(card['tag'], state='normal')
+                canvas.tag_raise(card['tag'])  # Keep later cards stacked on top
+                shown.append(card)
             else:
-                self.status_label.config(text="")
+                shown.append(self.create_stacked_seat_card_widget(rank, suit, canvas, current_x))
+            current_x += stack_offset
+
+        # Park cards this hand no longer shows (undo, reset) for reuse
+        while len(shown) > len(hand):
+            card = shown.pop()
+            canvas.itemconfigure(card['tag'], state='hidden')
+            pool.append(card)
+
+        return current_x
 
     def undo(self, hand_idx=None):
         """Remove the last card from specified hand."""
@@ -473,53 +562,46 @@ class SeatHandPanel(tk.Frame):
         self.is_busted = False  # Reset bust status
         # Reactivate hand if an undone card existed
         self.is_done = False
-        self.update_display()
+        self._schedule_update()
         self.show_action_buttons()
         return card
 
     def reset(self):
         """Clear all cards and reset state - clear split history."""
-        print(f"RESET: Resetting {self.seat}")
+        logger.debug("Resetting %s", self.seat)
 
-        # Clear all card widgets first
-        for hand_widgets in self.card_widgets:
-            for widget in hand_widgets:
-                try:
-                    widget.destroy()
-                except:
-                    pass
-
-        # Reset state
+        # Reset state (update_display() below parks the old card widgets)
         self.hands = [[]]
         self.current_hand = 0
         self.is_busted = False
         self.is_surrendered = False
         self.is_done = False
-        self.card_widgets = [[]]
 
         # Clear split history on reset
         self.split_history.clear()
-        print(f"RESET: Cleared split history for {self.seat}")
+        logger.debug("Cleared split history for %s", self.seat)
 
-        # Reset displays (keep only first one)
+        # Reset displays (keep only first one); reset() is the only place
+        # split displays are destroyed, and they leave the list right after
         for display in self.displays[1:]:
-            try:
-                display.destroy()
-            except:
-                pass
+            display.destroy()
         self.displays = self.displays[:1] if self.displays else []
+        # Cards of the destroyed split displays went with them
+        del self.card_widgets[len(self.displays):]
+        del self._card_pools[len(self.displays):]
+        del self._hand_labels[len(self.displays):]
 
         if not self.displays:
             self._add_hand_display()
 
-        self.update_display()
+        self._schedule_update()
         self._hide_action_buttons()
 
     def surrender(self):
         """Mark hand as surrendered."""
         self.is_surrendered = True
         self.is_done = True
-        self.update_display()
+        self._schedule_update()
 
     def show_action_buttons(self):
         """Show only skip button for other seats."""
@@ -534,13 +616,6 @@ class SeatHandPanel(tk.Frame):
 
     def highlight(self, active=True):
         """Highlight or unhighlight this seat."""
-        seat_frame = self.winfo_children()[0]
-        seat_label = seat_frame.winfo_children()[0]
-
-        if active:
-            seat_frame.config(bg=COLORS['bg_active_seat'])
-            seat_label.config(bg=COLORS['bg_active_seat'])
-        else:
-            bg_color = self._get_background_color()
-            seat_frame.config(bg=bg_color)
-            seat_label.config(bg=bg_color)
\ No newline at end of file
+        bg_color = COLORS['bg_active_seat'] if active else self._get_background_color()
+        self._seat_frame.config(bg=bg_color)
+        self._seat_label.config(bg=bg_color)
\ No newline at end of file